@@ -5,6 +5,7 @@ Takes a list of package names as command line arguments and returns a JSON dict
 mapping package names to boolean availability status.
 """
 
+import functools
 import json
 import sys
 import traceback
@@ -28,6 +29,20 @@ if hasattr(sys.stderr, "reconfigure"):
     sys.stderr.reconfigure(line_buffering=True)
 
 
+@functools.cache
+def _find_spec_available(package_name: str) -> bool:
+    """
+    Memoized ``find_spec`` lookup (walks ``sys.path``, so only do it once per name).
+
+    For dotted names the top-level package is resolved first (and cached), so a
+    missing parent short-circuits without importing anything.
+    """
+    top_level, sep, _ = package_name.partition(".")
+    if sep and top_level not in sys.modules and not _find_spec_available(top_level):
+        return False
+    return find_spec(package_name) is not None
+
+
 def check_package_availability(package_names: list[str]) -> dict[str, bool]:
     """
     Check if packages are available in the current Python environment.
@@ -45,15 +60,19 @@ def check_package_availability(package_names: list[str]) -> dict[str, bool]:
     )
 
     for package_name in package_names:
+        if package_name in sys.modules:
+            # Already imported: no need to walk sys.path
+            _log("DEBUG", f"  '{package_name}' found in sys.modules, available=True")
+            availability[package_name] = True
+            continue
         try:
             _log("DEBUG", f"Checking package: '{package_name}'")
             # Check if the package can be found
-            spec = find_spec(package_name)
-            available = spec is not None
+            available = _find_spec_available(package_name)
             availability[package_name] = available
             _log(
                 "DEBUG",
-                f"  find_spec('{package_name}') -> spec={spec!r}, available={available}",
+                f"  find_spec('{package_name}') -> available={available}",
             )
         except (ImportError, ModuleNotFoundError, ValueError) as e:
             # Package not available
@@ -4,20 +4,172 @@ Script to create sample scientific data files for testing the VSCode extension.
 This script creates sample files for all supported formats: NetCDF, HDF5, Zarr, GRIB, GeoTIFF, JPEG-2000.
 """
 
+import functools
 import importlib.util
 import os
+import shutil
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 
+# Every builder needs numpy and xarray, so they are imported once here. Optional
+# backends (zarr, rioxarray, eccodes, cdflib, ...) are only checked with
+# _optional_pkg_available and imported inside the builders that use them.
 import numpy as np
 import xarray as xr
 
+# Coordinate attributes shared by most samples. xarray copies attrs when a
+# variable is built, so the constants are never mutated through a dataset.
+_LAT_ATTRS = {"long_name": "Latitude", "units": "degrees_north"}
+_LON_ATTRS = {"long_name": "Longitude", "units": "degrees_east"}
+
+# Creation time reported in the "history" attribute: one timestamp per run, so
+# that all samples built together carry the same one. Worker processes started
+# with spawn/forkserver re-import this module, so main() hands them the parent's
+# value through _set_created_at.
+_CREATED_AT = datetime.now()
+
+
+def _set_created_at(created_at: datetime) -> None:
+    """Use ``created_at`` as the creation time (ProcessPoolExecutor initializer)."""
+    global _CREATED_AT
+    _CREATED_AT = created_at
+
 
 def _optional_pkg_available(dist_name: str) -> bool:
     """True if optional dependency is installed (metadata check only; no import)."""
     return importlib.util.find_spec(dist_name) is not None
 
 
+# Only the large seasonal fields get a compiled kernel. The GeoTIFF/JPEG-2000
+# bands are at most 200 x 200 and built from 1D outer products, so compiling a
+# kernel for them would cost more than the NumPy expressions it replaces.
+if _optional_pkg_available("numba"):
+    import numba
+
+    # No fastmath: the kernel must round exactly like the NumPy fallback below
+    @numba.njit(parallel=True, cache=True)
+    def _scale_and_add_seasonal(rows, sigma, seasonal):
+        """In place ``rows[t] = rows[t] * sigma + seasonal[t]``, all in float32."""
+        for t in numba.prange(rows.shape[0]):
+            for i in range(rows.shape[1]):
+                rows[t, i] = rows[t, i] * sigma + seasonal[t]
+
+else:
+    _scale_and_add_seasonal = None
+
+
+def _seasonal_field(
+    rng: np.random.Generator,
+    shape: tuple[int, ...],
+    mean: float,
+    amplitude: float,
+    period: float,
+    sigma: float,
+) -> np.ndarray:
+    """Return ``mean + amplitude * sin(2 pi t / period) + N(0, sigma)`` as float32.
+
+    ``t`` is the index along the first axis. The noise is drawn directly into the
+    output buffer and scaled/shifted in place, so no full-size temporary is built.
+    When numba is installed, scaling and the seasonal term are fused into a single
+    parallel pass over the buffer, with the same float32 results.
+    """
+    field = np.empty(shape, dtype=np.float32)
+    rng.standard_normal(dtype=np.float32, out=field)
+    seasonal = mean + amplitude * np.sin(2 * np.pi * np.arange(shape[0]) / period)
+    seasonal = seasonal.astype(np.float32)
+    if _scale_and_add_seasonal is not None:
+        _scale_and_add_seasonal(
+            field.reshape(shape[0], -1), np.float32(sigma), seasonal
+        )
+        return field
+    field *= np.float32(sigma)
+    field += seasonal.reshape((-1,) + (1,) * (len(shape) - 1))
+    return field
+
+
+def _exponential_field(
+    rng: np.random.Generator, shape: tuple[int, ...], scale: float
+) -> np.ndarray:
+    """Return exponential samples with mean ``scale`` as float32.
+
+    The samples are drawn by inverse transform, ``-scale * log(1 - U)`` with ``U``
+    uniform in [0, 1), computed in place in the output buffer: in float32 this is
+    faster than ``Generator.standard_exponential`` for the large fields.
+    """
+    field = rng.random(shape, dtype=np.float32)
+    np.negative(field, out=field)
+    np.log1p(field, out=field)
+    field *= -scale
+    return field
+
+
+def _ns_since_2000(times: np.ndarray) -> np.ndarray:
+    """Return ``datetime64`` times as int64 nanoseconds since 2000-01-01 00:00:00."""
+    return (times - np.datetime64("2000-01-01", "ns")).astype(np.int64)
+
+
+def _int16_packing(valid_min: float, valid_max: float) -> dict:
+    """Return CF ``scale_factor``/``add_offset`` encoding packing floats into int16.
+
+    ``[valid_min, valid_max]`` is mapped onto ``[-32767, 32767]``; ``-32768`` is
+    reserved for missing values. xarray applies the packing on write and undoes it
+    on read; float32 packing attributes make it decode back to float32.
+    """
+    return {
+        "dtype": "int16",
+        "scale_factor": np.float32((valid_max - valid_min) / 65534),
+        "add_offset": np.float32((valid_max + valid_min) / 2),
+        "_FillValue": -32768,
+    }
+
+
+@functools.cache
+def _global_latlon(nlat: int, nlon: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(lat, lon)`` axes spanning the globe, shared between builders.
+
+    The arrays are cached, hence read-only.
+    """
+    lat = np.linspace(-90, 90, nlat)
+    lon = np.linspace(-180, 180, nlon)
+    lat.flags.writeable = False
+    lon.flags.writeable = False
+    return lat, lon
+
+
+@functools.cache
+def _monthly_temperature() -> np.ndarray:
+    """Return the (12, 90, 180) temperature field of the NetCDF4 and CDF samples.
+
+    Both samples hold the same seeded field, which is built once and shared.
+    The array is cached, hence read-only.
+    """
+    rng = np.random.default_rng(303)
+    temperature = _seasonal_field(rng, (12, 90, 180), 15, 10, 12, 2)
+    temperature.flags.writeable = False
+    return temperature
+
+
+def _ocean_coords(
+    time: np.ndarray, depth: np.ndarray, lat: np.ndarray, lon: np.ndarray
+) -> dict:
+    """Return the ``time``/``depth``/``lat``/``lon`` coordinates of the ocean samples."""
+    return {
+        "time": (
+            ["time"],
+            time,
+            {"long_name": "Time", "units": "days since 2020-01-01"},
+        ),
+        "depth": (
+            ["depth"],
+            depth,
+            {"long_name": "Depth", "units": "m", "positive": "down"},
+        ),
+        "lat": (["lat"], lat, _LAT_ATTRS),
+        "lon": (["lon"], lon, _LON_ATTRS),
+    }
+
+
 # Suppress warnings for cleaner output
 warnings.filterwarnings("ignore")
 
@@ -35,27 +187,15 @@ def create_sample_netcdf():
     print("🌡️ Creating sample NetCDF file...")
 
     # Create time dimension
-    time = np.arange(0, 365, 1)
-    dates = [datetime(2020, 1, 1) + timedelta(days=int(t)) for t in time]
+    dates = np.datetime64("2020-01-01", "ns") + np.arange(365).astype("timedelta64[D]")
 
     # Create lat/lon grid
-    lat = np.linspace(-90, 90, 180)
-    lon = np.linspace(-180, 180, 360)
+    lat, lon = _global_latlon(180, 360)
 
     # Create sample data
-    np.random.seed(42)  # For reproducible data
-    # Reshape time for broadcasting
-    time_3d = time[:, np.newaxis, np.newaxis]
-    temperature = (
-        15
-        + 10 * np.sin(2 * np.pi * time_3d / 365)
-        + np.random.normal(0, 2, (365, 180, 360))
-    )
-    pressure = (
-        1013.25
-        + 20 * np.sin(2 * np.pi * time_3d / 365)
-        + np.random.normal(0, 5, (365, 180, 360))
-    )
+    rng = np.random.default_rng(42)  # For reproducible data
+    temperature = _seasonal_field(rng, (365, 180, 360), 15, 10, 365, 2)
+    pressure = _seasonal_field(rng, (365, 180, 360), 1013.25, 20, 365, 5)
 
     # Create dataset
     ds = xr.Dataset(
@@ -108,12 +248,28 @@ def create_sample_netcdf():
         "description": "Sample NetCDF file for testing VSCode extension",
         "institution": "Test Institution",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
     }
 
-    # Save to file
-    ds.to_netcdf(output_file)
+    # Save to file, chunked by month so time series and single maps both read
+    # only a few compressed chunks, packed as int16 (a few thousandths of a unit of
+    # resolution)
+    packing = {
+        "temperature": _int16_packing(-50.0, 80.0),
+        "pressure": _int16_packing(900.0, 1100.0),
+    }
+    encoding = {
+        name: {
+            **packing[name],
+            "zlib": True,
+            "complevel": 4,
+            "shuffle": True,
+            "chunksizes": (30, 90, 180),
+        }
+        for name in ("temperature", "pressure")
+    }
+    ds.to_netcdf(output_file, encoding=encoding)
     print(f"✅ Created {output_file}")
     return output_file
 
@@ -141,19 +297,9 @@ def create_sample_zarr_single_group_from_dataset():
     lon = np.linspace(-180, 180, 320)
 
     # Create sample ocean data
-    np.random.seed(123)
-    # Reshape time for broadcasting
-    time_4d = time[:, np.newaxis, np.newaxis, np.newaxis]
-    salinity = (
-        35
-        + 2 * np.sin(2 * np.pi * time_4d / 100)
-        + np.random.normal(0, 0.5, (100, 8, 160, 320))
-    )
-    temperature = (
-        20
-        - 10 * np.sin(2 * np.pi * time_4d / 100)
-        + np.random.normal(0, 1, (100, 8, 160, 320))
-    )
+    rng = np.random.default_rng(123)
+    salinity = _seasonal_field(rng, (100, 8, 160, 320), 35, 2, 100, 0.5)
+    temperature = _seasonal_field(rng, (100, 8, 160, 320), 20, -10, 100, 1)
 
     # Create dataset
     ds = xr.Dataset(
@@ -177,20 +323,7 @@ def create_sample_zarr_single_group_from_dataset():
                 },
             ),
         },
-        coords={
-            "time": (
-                ["time"],
-                time,
-                {"long_name": "Time", "units": "days since 2020-01-01"},
-            ),
-            "depth": (
-                ["depth"],
-                depth,
-                {"long_name": "Depth", "units": "m", "positive": "down"},
-            ),
-            "lat": (["lat"], lat, {"long_name": "Latitude", "units": "degrees_north"}),
-            "lon": (["lon"], lon, {"long_name": "Longitude", "units": "degrees_east"}),
-        },
+        coords=_ocean_coords(time, depth, lat, lon),
     )
 
     # Add global attributes
@@ -199,11 +332,31 @@ def create_sample_zarr_single_group_from_dataset():
         "description": "Sample Zarr file for testing VSCode extension",
         "institution": "Ocean Test Institute",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
     }
 
-    # Save to Zarr
-    ds.to_zarr(output_file)
+    # Save to Zarr with explicit chunks, packed as int16 and compressed per chunk
+    # with bit-shuffled zstd (fast, and the shuffle suits slowly varying fields)
+    from zarr.codecs import BloscCodec, BloscShuffle
+
+    packing = {
+        "salinity": _int16_packing(20.0, 50.0),
+        "temperature": _int16_packing(-10.0, 50.0),
+    }
+    compressor = BloscCodec(cname="zstd", clevel=1, shuffle=BloscShuffle.bitshuffle)
+    chunks = {"time": 10, "depth": 8, "lat": 80, "lon": 160}
+    encoding = {
+        name: {
+            **packing[name],
+            "chunks": tuple(chunks.values()),
+            "compressors": (compressor,),
+        }
+        for name in ("salinity", "temperature")
+    }
+    if _optional_pkg_available("dask"):
+        # Matching dask chunks let xarray encode and store the chunks in threads
+        ds = ds.chunk(chunks)
+    ds.to_zarr(output_file, encoding=encoding)
     print(f"✅ Created {output_file}")
     return output_file
 
@@ -235,22 +388,13 @@ def create_sample_zarr_with_nested_groups_from_datatree():
     lon = np.linspace(-180, 180, 120)
 
     # Create sample data
-    np.random.seed(789)
-    time_4d = time[:, np.newaxis, np.newaxis, np.newaxis]
+    rng = np.random.default_rng(789)
 
     # Create temperature data
-    temperature = (
-        20
-        - 10 * np.sin(2 * np.pi * time_4d / 30)
-        + np.random.normal(0, 1, (30, 6, 60, 120))
-    )
+    temperature = _seasonal_field(rng, (30, 6, 60, 120), 20, -10, 30, 1)
 
     # Create salinity data
-    salinity = (
-        35
-        + 2 * np.sin(2 * np.pi * time_4d / 30)
-        + np.random.normal(0, 0.5, (30, 6, 60, 120))
-    )
+    salinity = _seasonal_field(rng, (30, 6, 60, 120), 35, 2, 30, 0.5)
 
     # Create datasets for different groups
     # Root level dataset
@@ -275,7 +419,7 @@ def create_sample_zarr_with_nested_groups_from_datatree():
         "description": "Sample xr.DataTree Zarr file for testing VSCode extension",
         "institution": "Ocean Test Institute",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
     }
 
@@ -303,20 +447,7 @@ def create_sample_zarr_with_nested_groups_from_datatree():
                 },
             ),
         },
-        coords={
-            "time": (
-                ["time"],
-                time,
-                {"long_name": "Time", "units": "days since 2020-01-01"},
-            ),
-            "depth": (
-                ["depth"],
-                depth,
-                {"long_name": "Depth", "units": "m", "positive": "down"},
-            ),
-            "lat": (["lat"], lat, {"long_name": "Latitude", "units": "degrees_north"}),
-            "lon": (["lon"], lon, {"long_name": "Longitude", "units": "degrees_east"}),
-        },
+        coords=_ocean_coords(time, depth, lat, lon),
     )
     ocean_ds.attrs = {
         "description": "Oceanographic measurements",
@@ -337,20 +468,7 @@ def create_sample_zarr_with_nested_groups_from_datatree():
                 },
             ),
         },
-        coords={
-            "time": (
-                ["time"],
-                time,
-                {"long_name": "Time", "units": "days since 2020-01-01"},
-            ),
-            "depth": (
-                ["depth"],
-                depth,
-                {"long_name": "Depth", "units": "m", "positive": "down"},
-            ),
-            "lat": (["lat"], lat, {"long_name": "Latitude", "units": "degrees_north"}),
-            "lon": (["lon"], lon, {"long_name": "Longitude", "units": "degrees_east"}),
-        },
+        coords=_ocean_coords(time, depth, lat, lon),
     )
     physical_ds.attrs = {
         "description": "Physical oceanographic properties",
@@ -362,7 +480,7 @@ def create_sample_zarr_with_nested_groups_from_datatree():
         {
             "nitrate": (
                 ["time", "depth", "lat", "lon"],
-                np.random.exponential(2, (30, 6, 60, 120)).astype("f4"),
+                _exponential_field(rng, (30, 6, 60, 120), 2),
                 {
                     "long_name": "Nitrate Concentration",
                     "units": "μmol/L",
@@ -371,7 +489,7 @@ def create_sample_zarr_with_nested_groups_from_datatree():
             ),
             "phosphate": (
                 ["time", "depth", "lat", "lon"],
-                np.random.exponential(0.5, (30, 6, 60, 120)).astype("f4"),
+                _exponential_field(rng, (30, 6, 60, 120), 0.5),
                 {
                     "long_name": "Phosphate Concentration",
                     "units": "μmol/L",
@@ -379,32 +497,21 @@ def create_sample_zarr_with_nested_groups_from_datatree():
                 },
             ),
         },
-        coords={
-            "time": (
-                ["time"],
-                time,
-                {"long_name": "Time", "units": "days since 2020-01-01"},
-            ),
-            "depth": (
-                ["depth"],
-                depth,
-                {"long_name": "Depth", "units": "m", "positive": "down"},
-            ),
-            "lat": (["lat"], lat, {"long_name": "Latitude", "units": "degrees_north"}),
-            "lon": (["lon"], lon, {"long_name": "Longitude", "units": "degrees_east"}),
-        },
+        coords=_ocean_coords(time, depth, lat, lon),
     )
     chemical_ds.attrs = {
         "description": "Chemical oceanographic properties",
         "measurement_type": "laboratory",
     }
 
-    # Quality control subgroup
+    # Quality control subgroup: both variables share one flag array, as in the
+    # nested Zarr sample
+    quality_flags = rng.integers(0, 4, (30, 6, 60, 120), dtype="i1")
     qc_ds = xr.Dataset(
         {
             "temperature_qc": (
                 ["time", "depth", "lat", "lon"],
-                np.random.randint(0, 4, (30, 6, 60, 120), dtype="i1"),
+                quality_flags,
                 {
                     "long_name": "Temperature Quality Control",
                     "units": "1",
@@ -414,7 +521,7 @@ def create_sample_zarr_with_nested_groups_from_datatree():
             ),
             "salinity_qc": (
                 ["time", "depth", "lat", "lon"],
-                np.random.randint(0, 4, (30, 6, 60, 120), dtype="i1"),
+                quality_flags,
                 {
                     "long_name": "Salinity Quality Control",
                     "units": "1",
@@ -423,36 +530,40 @@ def create_sample_zarr_with_nested_groups_from_datatree():
                 },
             ),
         },
-        coords={
-            "time": (
-                ["time"],
-                time,
-                {"long_name": "Time", "units": "days since 2020-01-01"},
-            ),
-            "depth": (
-                ["depth"],
-                depth,
-                {"long_name": "Depth", "units": "m", "positive": "down"},
-            ),
-            "lat": (["lat"], lat, {"long_name": "Latitude", "units": "degrees_north"}),
-            "lon": (["lon"], lon, {"long_name": "Longitude", "units": "degrees_east"}),
-        },
+        coords=_ocean_coords(time, depth, lat, lon),
     )
     qc_ds.attrs = {
         "description": "Quality control flags and information",
         "qc_version": "1.2",
     }
 
-    # Create xr.DataTree structure
-    dt = xr.DataTree(name="root")
-    dt["topgroup"] = topgroup_ds
-    dt["topgroup/ocean_data"] = ocean_ds
-    dt["topgroup/ocean_data/physical_properties"] = physical_ds
-    dt["topgroup/ocean_data/chemical_properties"] = chemical_ds
-    dt["topgroup/ocean_data/quality_control"] = qc_ds
+    # Create xr.DataTree structure in one go
+    dt = xr.DataTree.from_dict(
+        {
+            "topgroup": topgroup_ds,
+            "topgroup/ocean_data": ocean_ds,
+            "topgroup/ocean_data/physical_properties": physical_ds,
+            "topgroup/ocean_data/chemical_properties": chemical_ds,
+            "topgroup/ocean_data/quality_control": qc_ds,
+        },
+        name="root",
+    )
 
-    # Save to Zarr using xr.DataTree's to_zarr method
-    dt.to_zarr(output_file, mode="w")
+    # Save to Zarr using xr.DataTree's to_zarr method, compressing the 4D
+    # variables with bit-shuffled zstd in chunks of ten time steps, as in the
+    # single-group sample
+    from zarr.codecs import BloscCodec, BloscShuffle
+
+    compressor = BloscCodec(cname="zstd", clevel=1, shuffle=BloscShuffle.bitshuffle)
+    encoding = {
+        node.path: {
+            name: {"chunks": (10, 6, 60, 120), "compressors": (compressor,)}
+            for name, var in node.data_vars.items()
+            if var.ndim == 4
+        }
+        for node in dt.subtree
+    }
+    dt.to_zarr(output_file, mode="w", encoding=encoding)
     print(f"✅ Created {output_file} with xr.DataTree structure")
     return output_file
 
@@ -485,7 +596,7 @@ def create_sample_zarr_with_nested_groups_from_zarr():
             "description": "Sample Zarr file with nested groups for testing VSCode extension",
             "institution": "Ocean Test Institute",
             "source": "Generated for testing",
-            "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
             "Conventions": "CF-1.6",
         }
     )
@@ -495,6 +606,8 @@ def create_sample_zarr_with_nested_groups_from_zarr():
     depth = np.array([0, 10, 20, 50, 100, 200])
     lat = np.linspace(-60, 60, 80)
     lon = np.linspace(-180, 180, 160)
+    # Coordinates written next to the data of each level 3 group
+    coordinates = {"time": time, "depth": depth, "latitude": lat, "longitude": lon}
 
     # Level 1: Ocean data group
     ocean_group = root.create_group("ocean_data")
@@ -525,20 +638,24 @@ def create_sample_zarr_with_nested_groups_from_zarr():
         }
     )
 
+    # All 4D arrays are chunked by ten time steps over the full depth and grid
+    # (about 3 MB of float32 per chunk, five chunks per array) and compressed
+    # with bit-shuffled zstd, as in the xarray-written samples
+    from zarr.codecs import BloscCodec, BloscShuffle
+
+    chunks = (10, 6, 80, 160)
+    compressor = BloscCodec(cname="zstd", clevel=1, shuffle=BloscShuffle.bitshuffle)
+
     # Create temperature data
-    np.random.seed(456)
-    time_4d = time[:, np.newaxis, np.newaxis, np.newaxis]
-    temperature = (
-        20
-        - 10 * np.sin(2 * np.pi * time_4d / 50)
-        + np.random.normal(0, 1, (50, 6, 80, 160))
-    )
+    rng = np.random.default_rng(456)
+    temperature = _seasonal_field(rng, (50, 6, 80, 160), 20, -10, 50, 1)
 
     # Add temperature array to the deepest group
     temp_array = temp_group.create_array(
         "values",
         data=temperature,
-        chunks=(10, 2, 20, 40),
+        chunks=chunks,
+        compressors=compressor,
     )
     temp_array.attrs.update(
         {
@@ -550,10 +667,8 @@ def create_sample_zarr_with_nested_groups_from_zarr():
     )
 
     # Add coordinates to the temperature group
-    temp_group.create_array("time", data=time)
-    temp_group.create_array("depth", data=depth)
-    temp_group.create_array("latitude", data=lat)
-    temp_group.create_array("longitude", data=lon)
+    for name, values in coordinates.items():
+        temp_group.create_array(name, data=values)
 
     # Level 3: Salinity data group (same level as temperature)
     salinity_group = physical_group.create_group("salinity")
@@ -566,16 +681,13 @@ def create_sample_zarr_with_nested_groups_from_zarr():
     )
 
     # Create salinity data
-    salinity = (
-        35
-        + 2 * np.sin(2 * np.pi * time_4d / 50)
-        + np.random.normal(0, 0.5, (50, 6, 80, 160))
-    )
+    salinity = _seasonal_field(rng, (50, 6, 80, 160), 35, 2, 50, 0.5)
 
     salinity_array = salinity_group.create_array(
         "values",
         data=salinity,
-        chunks=(10, 2, 20, 40),
+        chunks=chunks,
+        compressors=compressor,
     )
     salinity_array.attrs.update(
         {
@@ -587,10 +699,8 @@ def create_sample_zarr_with_nested_groups_from_zarr():
     )
 
     # Add coordinates to the salinity group
-    salinity_group.create_array("time", data=time)
-    salinity_group.create_array("depth", data=depth)
-    salinity_group.create_array("latitude", data=lat)
-    salinity_group.create_array("longitude", data=lon)
+    for name, values in coordinates.items():
+        salinity_group.create_array(name, data=values)
 
     # Level 2: Chemical properties group
     chemical_group = ocean_group.create_group("chemical_properties")
@@ -608,19 +718,23 @@ def create_sample_zarr_with_nested_groups_from_zarr():
     )
 
     # Create nutrient data (nitrate, phosphate, silicate)
-    nitrate = np.random.exponential(2, (50, 6, 80, 160)).astype("f4")
-    phosphate = np.random.exponential(0.5, (50, 6, 80, 160)).astype("f4")
-    silicate = np.random.exponential(10, (50, 6, 80, 160)).astype("f4")
+    nitrate = _exponential_field(rng, (50, 6, 80, 160), 2)
+    phosphate = _exponential_field(rng, (50, 6, 80, 160), 0.5)
+    silicate = _exponential_field(rng, (50, 6, 80, 160), 10)
 
-    nutrients_group.create_array("nitrate", data=nitrate, chunks=(10, 2, 20, 40))
-    nutrients_group.create_array("phosphate", data=phosphate, chunks=(10, 2, 20, 40))
-    nutrients_group.create_array("silicate", data=silicate, chunks=(10, 2, 20, 40))
+    nutrients_group.create_array(
+        "nitrate", data=nitrate, chunks=chunks, compressors=compressor
+    )
+    nutrients_group.create_array(
+        "phosphate", data=phosphate, chunks=chunks, compressors=compressor
+    )
+    nutrients_group.create_array(
+        "silicate", data=silicate, chunks=chunks, compressors=compressor
+    )
 
     # Add coordinates to nutrients group
-    nutrients_group.create_array("time", data=time)
-    nutrients_group.create_array("depth", data=depth)
-    nutrients_group.create_array("latitude", data=lat)
-    nutrients_group.create_array("longitude", data=lon)
+    for name, values in coordinates.items():
+        nutrients_group.create_array(name, data=values)
 
     # Level 1: Metadata group
     metadata_group = root.create_group("metadata")
@@ -644,11 +758,13 @@ def create_sample_zarr_with_nested_groups_from_zarr():
     )
 
     # Create quality flags
-    quality_flags = np.random.randint(0, 4, (50, 6, 80, 160), dtype="i1")
+    quality_flags = rng.integers(0, 4, (50, 6, 80, 160), dtype="i1")
+    flags_group.create_array(
+        "temperature_qc", data=quality_flags, chunks=chunks, compressors=compressor
+    )
     flags_group.create_array(
-        "temperature_qc", data=quality_flags, chunks=(10, 2, 20, 40)
+        "salinity_qc", data=quality_flags, chunks=chunks, compressors=compressor
     )
-    flags_group.create_array("salinity_qc", data=quality_flags, chunks=(10, 2, 20, 40))
 
     # Add some scalar metadata at different levels
     root.attrs["total_groups"] = 7
@@ -657,6 +773,11 @@ def create_sample_zarr_with_nested_groups_from_zarr():
     temp_group.attrs["min_temp"] = float(np.min(temperature))
     temp_group.attrs["max_temp"] = float(np.max(temperature))
 
+    # Gather the metadata of all groups and arrays into the root zarr.json, as
+    # xarray's to_zarr does for the other Zarr samples, so that opening the
+    # store reads one document instead of walking every node
+    zarr.consolidate_metadata(output_file)
+
     print(f"✅ Created {output_file} with nested groups (3+ levels deep)")
     return output_file
 
@@ -757,15 +878,9 @@ def create_sample_hdf5():
     lon = np.linspace(-180, 180, 240)
 
     # Create sample satellite data
-    np.random.seed(456)
-    # Reshape time for broadcasting
-    time_3d = time[:, np.newaxis, np.newaxis]
-    reflectance = (
-        0.1
-        + 0.2 * np.sin(2 * np.pi * time_3d / 30)
-        + np.random.normal(0, 0.05, (30, 120, 240))
-    )
-    cloud_mask = np.random.randint(0, 2, (30, 120, 240))
+    rng = np.random.default_rng(456)
+    reflectance = _seasonal_field(rng, (30, 120, 240), 0.1, 0.2, 30, 0.05)
+    cloud_mask = rng.integers(0, 2, (30, 120, 240), dtype=np.uint8)
 
     # Create dataset
     ds = xr.Dataset(
@@ -796,8 +911,8 @@ def create_sample_hdf5():
                 time,
                 {"long_name": "Time", "units": "days since 2020-01-01"},
             ),
-            "lat": (["lat"], lat, {"long_name": "Latitude", "units": "degrees_north"}),
-            "lon": (["lon"], lon, {"long_name": "Longitude", "units": "degrees_east"}),
+            "lat": (["lat"], lat, _LAT_ATTRS),
+            "lon": (["lon"], lon, _LON_ATTRS),
         },
     )
 
@@ -807,12 +922,21 @@ def create_sample_hdf5():
         "description": "Sample HDF5 file for testing VSCode extension",
         "institution": "Satellite Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
     }
 
     # Save to HDF5
-    ds.to_netcdf(output_file, engine="h5netcdf")
+    encoding = {
+        name: {
+            "zlib": True,
+            "complevel": 4,
+            "shuffle": True,
+            "chunksizes": (10, 60, 120),
+        }
+        for name in ("reflectance", "cloud_mask")
+    }
+    ds.to_netcdf(output_file, engine="h5netcdf", encoding=encoding)
     print(f"✅ Created {output_file}")
     return output_file
 
@@ -839,23 +963,16 @@ def create_sample_grib():
 
     # Create time dimension
     time = np.arange(0, 24, 6)  # 6-hourly data for 24 hours
-    dates = [datetime(2020, 1, 1) + timedelta(hours=int(t)) for t in time]
+    dates = np.datetime64("2020-01-01", "ns") + time.astype("timedelta64[h]")
 
     # Create lat/lon grid to match GRIB sample (496 values = 31x16 grid)
     lat = np.linspace(60, 30, 16)  # Match the sample's latitude range
     lon = np.linspace(0, 30, 31)  # Match the sample's longitude range
 
-    # Create sample weather data
-    np.random.seed(789)
-    time_3d = time[:, np.newaxis, np.newaxis]
-    temperature = (
-        15 + 10 * np.sin(2 * np.pi * time_3d / 24) + np.random.normal(0, 2, (4, 16, 31))
-    )
-    pressure = (
-        1013.25
-        + 20 * np.sin(2 * np.pi * time_3d / 24)
-        + np.random.normal(0, 5, (4, 16, 31))
-    )
+    # Create sample weather data (daily cycle: 4 time steps of 6 hours)
+    rng = np.random.default_rng(789)
+    temperature = _seasonal_field(rng, (4, 16, 31), 15, 10, 4, 2)
+    pressure = _seasonal_field(rng, (4, 16, 31), 1013.25, 20, 4, 5)
 
     # Create dataset
     ds = xr.Dataset(
@@ -884,12 +1001,12 @@ def create_sample_grib():
             "latitude": (
                 ["latitude"],
                 lat,
-                {"long_name": "Latitude", "units": "degrees_north"},
+                _LAT_ATTRS,
             ),
             "longitude": (
                 ["longitude"],
                 lon,
-                {"long_name": "Longitude", "units": "degrees_east"},
+                _LON_ATTRS,
             ),
         },
     )
@@ -900,53 +1017,53 @@ def create_sample_grib():
         "description": "Sample GRIB file for testing VSCode extension",
         "institution": "Weather Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
     }
 
     # Save to GRIB using eccodes directly
     try:
-        # Create GRIB file using eccodes - try the simplest approach first
-        with open(output_file, "wb") as f:
-            for i, time_val in enumerate(dates):
-                # Create a new GRIB message from sample
-                grib_id = eccodes.codes_grib_new_from_samples("regular_ll_sfc_grib2")
-
-                try:
-                    # Set only the most basic parameters
-                    eccodes.codes_set_string(grib_id, "shortName", "t")
-                    eccodes.codes_set_long(
-                        grib_id, "dataDate", int(time_val.strftime("%Y%m%d"))
-                    )
-                    eccodes.codes_set_long(
-                        grib_id, "dataTime", int(time_val.strftime("%H%M"))
-                    )
-
-                    # Set data values
-                    data_2d = ds["t"].isel(time=i).values
-                    # Resize data to match the GRIB grid if needed
-                    if data_2d.size != eccodes.codes_get_size(grib_id, "values"):
-                        # Get the expected size from the GRIB message
-                        expected_size = eccodes.codes_get_size(grib_id, "values")
-                        # Resize or pad the data
+        # Parse the sample message once and clone it for each time step
+        template_id = eccodes.codes_grib_new_from_samples("regular_ll_sfc_grib2")
+        try:
+            # Set only the most basic parameters
+            eccodes.codes_set_string(template_id, "shortName", "t")
+            expected_size = eccodes.codes_get_size(template_id, "values")
+            # Values buffer for steps smaller than the grid: only its head is
+            # overwritten, so the zero padding is set once for all steps
+            padded_data = np.zeros(expected_size)
+            with open(output_file, "wb") as f:
+                for i, time_val in enumerate(dates.astype("datetime64[s]").tolist()):
+                    grib_id = eccodes.codes_clone(template_id)
+
+                    try:
+                        eccodes.codes_set_long(
+                            grib_id, "dataDate", int(time_val.strftime("%Y%m%d"))
+                        )
+                        eccodes.codes_set_long(
+                            grib_id, "dataTime", int(time_val.strftime("%H%M"))
+                        )
+
+                        # Set data values
+                        data_2d = ds["t"].isel(time=i).values.ravel()
+                        # Resize data to match the GRIB grid if needed
                         if data_2d.size < expected_size:
                             # Pad with zeros
-                            padded_data = np.zeros(expected_size)
-                            padded_data[: data_2d.size] = data_2d.flatten()
+                            padded_data[: data_2d.size] = data_2d
                             data_2d = padded_data
                         else:
-                            # Truncate
-                            data_2d = data_2d.flatten()[:expected_size]
-                    else:
-                        data_2d = data_2d.flatten()
+                            # Truncate (a no-op view when the sizes match)
+                            data_2d = data_2d[:expected_size]
 
-                    eccodes.codes_set_values(grib_id, data_2d)
+                        eccodes.codes_set_values(grib_id, data_2d)
 
-                    # Write the message
-                    eccodes.codes_write(grib_id, f)
+                        # Write the message
+                        eccodes.codes_write(grib_id, f)
 
-                finally:
-                    eccodes.codes_release(grib_id)
+                    finally:
+                        eccodes.codes_release(grib_id)
+        finally:
+            eccodes.codes_release(template_id)
 
         print(f"✅ Created {output_file} (GRIB format)")
 
@@ -954,11 +1071,9 @@ def create_sample_grib():
         print(f"  ⚠️ Error writing GRIB file with eccodes: {e}")
         print("  🔄 Falling back to NetCDF format with .grib extension")
         # Fallback to NetCDF format
-        temp_file = output_file.replace(".grib", "_temp.nc")
-        ds.to_netcdf(temp_file, engine="netcdf4")
-        import shutil
-
-        shutil.move(temp_file, output_file)
+        # netCDF4 does not care about the extension: write in place, replacing any
+        # partial GRIB output
+        ds.to_netcdf(output_file, engine="netcdf4")
         print(f"✅ Created {output_file} (NetCDF format with .grib extension)")
 
     return output_file
@@ -976,120 +1091,130 @@ def create_sample_geotiff():
 
     print("🛰️ Creating sample GeoTIFF file...")
 
-    if not _optional_pkg_available("rioxarray"):
-        print("  ❌ rioxarray not available, skipping GeoTIFF file creation.")
+    # rasterio is installed alongside rioxarray, which the extension needs to
+    # read GeoTIFF files
+    if not _optional_pkg_available("rasterio"):
+        print("  ❌ rasterio not available, skipping GeoTIFF file creation.")
         return None
-    importlib.import_module("rioxarray")  # register xarray .rio accessor
+    import rasterio
+    from rasterio.transform import from_origin
 
-    print("  ✅ rioxarray available, creating GeoTIFF file")
+    print("  ✅ rasterio available, creating GeoTIFF file")
 
     # Create spatial dimensions
     height = 200
     width = 200
 
     # Create sample satellite imagery data
-    np.random.seed(101)
-
-    # Create RGB bands with more realistic satellite-like patterns
-    x, y = np.meshgrid(np.linspace(0, 1, width), np.linspace(0, 1, height))
-
-    # Create more complex patterns that look like satellite imagery
-    red = np.clip(
-        100
-        + 80 * np.sin(2 * np.pi * x) * np.cos(2 * np.pi * y)
-        + 30 * np.sin(8 * np.pi * x) * np.cos(8 * np.pi * y)
-        + np.random.normal(0, 20, (height, width)),
-        0,
-        255,
-    ).astype(np.uint8)
-
-    green = np.clip(
-        120
-        + 60 * np.cos(3 * np.pi * x) * np.sin(3 * np.pi * y)
-        + 25 * np.sin(6 * np.pi * x) * np.cos(6 * np.pi * y)
-        + np.random.normal(0, 15, (height, width)),
-        0,
-        255,
-    ).astype(np.uint8)
-
-    blue = np.clip(
-        80
-        + 70 * np.sin(4 * np.pi * x) * np.cos(4 * np.pi * y)
-        + 35 * np.sin(10 * np.pi * x) * np.cos(10 * np.pi * y)
-        + np.random.normal(0, 18, (height, width)),
-        0,
-        255,
-    ).astype(np.uint8)
+    rng = np.random.default_rng(101)
+
+    # Create RGB bands with more realistic satellite-like patterns. The bands
+    # end up as uint8, so float32 is plenty for the synthesis: coordinates,
+    # waves and noise are all float32 and no step is promoted to float64
+    x = np.linspace(0, 1, width, dtype=np.float32)
+    y = np.linspace(0, 1, height, dtype=np.float32)
+
+    # Create more complex patterns that look like satellite imagery: per band,
+    # an offset, two (amplitude, wavenumber, y profile, x profile) waves and
+    # the standard deviation of the noise
+    band_patterns = [
+        (100, ((80, 2, np.cos, np.sin), (30, 8, np.cos, np.sin)), 20),
+        (120, ((60, 3, np.sin, np.cos), (25, 6, np.cos, np.sin)), 15),
+        (80, ((70, 4, np.cos, np.sin), (35, 10, np.cos, np.sin)), 18),
+    ]
 
-    # Create dataset with proper geospatial information
-    ds = xr.Dataset(
-        {
-            "red": (
-                ["y", "x"],
-                red,
-                {
-                    "long_name": "Red band",
-                    "units": "DN",
-                    "description": "Red channel of satellite imagery",
-                },
-            ),
-            "green": (
-                ["y", "x"],
-                green,
-                {
-                    "long_name": "Green band",
-                    "units": "DN",
-                    "description": "Green channel of satellite imagery",
-                },
-            ),
-            "blue": (
-                ["y", "x"],
-                blue,
-                {
-                    "long_name": "Blue band",
-                    "units": "DN",
-                    "description": "Blue channel of satellite imagery",
-                },
-            ),
+    # Accumulate each band in place in a float scratch buffer, then clip it and
+    # cast it into its slot of the uint8 stack, instead of allocating a float
+    # temporary per term plus separate clip and astype outputs
+    rgb = np.empty((len(band_patterns), height, width), dtype=np.uint8)
+    band = np.empty((height, width), dtype=np.float32)
+    wave = np.empty((height, width), dtype=np.float32)
+    # The noise of all bands is drawn at once, then scaled per band
+    noise = rng.standard_normal((len(band_patterns), height, width), dtype=np.float32)
+    for out, band_noise, (offset, waves, noise_std) in zip(
+        rgb, noise, band_patterns, strict=True
+    ):
+        band.fill(offset)
+        for amplitude, k, y_profile, x_profile in waves:
+            np.outer(y_profile(k * np.pi * y), x_profile(k * np.pi * x), out=wave)
+            wave *= amplitude
+            band += wave
+        band_noise *= noise_std
+        band += band_noise
+        np.clip(band, 0, 255, out=band)
+        out[...] = band
+
+    # Band attributes become band tags, and long names band descriptions
+    bands = {
+        "red": {
+            "long_name": "Red band",
+            "units": "DN",
+            "description": "Red channel of satellite imagery",
         },
-        coords={
-            "x": (
-                ["x"],
-                np.linspace(-180, 180, width),
-                {"long_name": "Longitude", "units": "degrees_east"},
-            ),
-            "y": (
-                ["y"],
-                np.linspace(90, -90, height),
-                {"long_name": "Latitude", "units": "degrees_north"},
-            ),
+        "green": {
+            "long_name": "Green band",
+            "units": "DN",
+            "description": "Green channel of satellite imagery",
         },
-    )
-
-    # Add CRS information
-    ds = ds.rio.write_crs("EPSG:4326")
+        "blue": {
+            "long_name": "Blue band",
+            "units": "DN",
+            "description": "Blue channel of satellite imagery",
+        },
+    }
 
-    # Add global attributes
-    ds.attrs = {
+    # Global attributes, written as dataset tags
+    attrs = {
         "title": "Sample Satellite Imagery",
         "description": "Sample GeoTIFF file for testing VSCode extension",
         "institution": "Satellite Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
         "spatial_resolution": "1 degree",
         "temporal_coverage": "2020-01-01",
     }
 
-    # Save to GeoTIFF with compression
-    try:
-        ds.rio.to_raster(output_file, compress="lzw")
-        print(f"✅ Created {output_file} (compressed GeoTIFF)")
-    except Exception:
-        # Fallback to uncompressed if compression fails
-        ds.rio.to_raster(output_file)
-        print(f"✅ Created {output_file} (uncompressed GeoTIFF)")
+    # Pixel centers span -180..180 degrees east and 90..-90 degrees north
+    lon = np.linspace(-180, 180, width)
+    lat = np.linspace(90, -90, height)
+    res_x = lon[1] - lon[0]
+    res_y = lat[0] - lat[1]
+    profile = {
+        "driver": "GTiff",
+        "width": width,
+        "height": height,
+        "count": len(bands),
+        "dtype": "uint8",
+        "crs": "EPSG:4326",
+        "transform": from_origin(lon[0] - res_x / 2, lat[0] + res_y / 2, res_x, res_y),
+    }
 
+    def write_raster(**creation_options):
+        # Write the three bands with rasterio directly: the data is already a
+        # plain uint8 stack, so the rioxarray layer adds nothing
+        with rasterio.open(output_file, "w", **profile, **creation_options) as dst:
+            dst.write(rgb)
+            for band, band_attrs in enumerate(bands.values(), start=1):
+                dst.set_band_description(band, band_attrs["long_name"])
+                dst.update_tags(band, **band_attrs)
+            dst.update_tags(**attrs)
+
+    # Save to GeoTIFF with compression: zstd on horizontal differences suits
+    # the smooth bands best (about two thirds of the LZW size), LZW covers GDAL
+    # builds without zstd, and uncompressed is the last resort
+    for creation_options in (
+        {"compress": "zstd", "zstd_level": 1, "predictor": 2},
+        {"compress": "lzw"},
+    ):
+        try:
+            write_raster(**creation_options)
+            print(f"✅ Created {output_file} (compressed GeoTIFF)")
+            return output_file
+        except Exception:
+            continue
+    write_raster()
+    print(f"✅ Created {output_file} (uncompressed GeoTIFF)")
     return output_file
 
 
@@ -1105,10 +1230,13 @@ def create_sample_jp2():
 
     print("📸 Creating sample JPEG-2000 file...")
 
-    if not _optional_pkg_available("rioxarray"):
-        print("  ❌ rioxarray not available, skipping JPEG-2000 file creation.")
+    # rasterio is installed alongside rioxarray, which the extension needs to
+    # read JPEG-2000 files
+    if not _optional_pkg_available("rasterio"):
+        print("  ❌ rasterio not available, skipping JPEG-2000 file creation.")
         return None
-    importlib.import_module("rioxarray")  # register xarray .rio accessor
+    import rasterio
+    from rasterio.transform import from_origin
 
     # Create spatial dimensions
     height = 50
@@ -1120,45 +1248,50 @@ def create_sample_jp2():
     # Create single band data
     data = np.random.randint(0, 255, (height, width), dtype=np.uint8)
 
-    # Add spatial patterns
-    x, y = np.meshgrid(np.linspace(0, 1, width), np.linspace(0, 1, height))
-    data = np.clip(
-        data + 100 * np.sin(10 * np.pi * x) * np.cos(10 * np.pi * y), 0, 255
-    ).astype(np.uint8)
+    # Add spatial patterns, clipped in place and cast back into the uint8 band
+    x = np.linspace(0, 1, width)
+    y = np.linspace(0, 1, height)
+    pattern = np.outer(np.cos(10 * np.pi * y), np.sin(10 * np.pi * x))
+    pattern *= 100
+    pattern += data
+    np.clip(pattern, 0, 255, out=pattern)
+    data[...] = pattern
 
-    # Create dataset
-    ds = xr.Dataset(
-        {
-            "band1": (["y", "x"], data, {"long_name": "Satellite band", "units": "DN"}),
-        },
-        coords={
-            "x": (
-                ["x"],
-                np.linspace(-10, 10, width),
-                {"long_name": "X coordinate", "units": "m"},
-            ),
-            "y": (
-                ["y"],
-                np.linspace(10, -10, height),
-                {"long_name": "Y coordinate", "units": "m"},
-            ),
-        },
-    )
+    # Band attributes become band tags, and the long name the band description
+    band_attrs = {"long_name": "Satellite band", "units": "DN"}
 
-    # Add CRS information
-    ds = ds.rio.write_crs("EPSG:3857")  # Web Mercator
-
-    # Add global attributes
-    ds.attrs = {
+    # Global attributes, written as dataset tags
+    attrs = {
         "title": "Sample JPEG-2000 Data",
         "description": "Sample JPEG-2000 file for testing VSCode extension",
         "institution": "Satellite Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
     }
 
-    # Save to JPEG-2000
-    ds.rio.to_raster(output_file)
+    # Pixel centers span -10..10 m east and 10..-10 m north (Web Mercator)
+    x = np.linspace(-10, 10, width)
+    y = np.linspace(10, -10, height)
+    res_x = x[1] - x[0]
+    res_y = y[0] - y[1]
+
+    # Save to JPEG-2000 with rasterio directly: for a single uint8 band, an
+    # xarray Dataset and the rioxarray layer only add a conversion step
+    with rasterio.open(
+        output_file,
+        "w",
+        driver="JP2OpenJPEG",
+        width=width,
+        height=height,
+        count=1,
+        dtype="uint8",
+        crs="EPSG:3857",
+        transform=from_origin(x[0] - res_x / 2, y[0] + res_y / 2, res_x, res_y),
+    ) as dst:
+        dst.write(data, 1)
+        dst.set_band_description(1, band_attrs["long_name"])
+        dst.update_tags(1, **band_attrs)
+        dst.update_tags(**attrs)
     print(f"✅ Created {output_file}")
     return output_file
 
@@ -1177,20 +1310,13 @@ def create_sample_netcdf4():
 
     # Create time dimension
     time = np.arange(0, 12, 1)  # Monthly data
-    dates = [datetime(2020, 1, 1) + timedelta(days=int(t * 30)) for t in time]
+    dates = np.datetime64("2020-01-01", "ns") + (time * 30).astype("timedelta64[D]")
 
     # Create lat/lon grid
-    lat = np.linspace(-90, 90, 90)
-    lon = np.linspace(-180, 180, 180)
+    lat, lon = _global_latlon(90, 180)
 
     # Create sample climate data
-    np.random.seed(303)
-    time_3d = time[:, np.newaxis, np.newaxis]
-    temperature = (
-        15
-        + 10 * np.sin(2 * np.pi * time_3d / 12)
-        + np.random.normal(0, 2, (12, 90, 180))
-    )
+    temperature = _monthly_temperature()
 
     # Create dataset
     ds = xr.Dataset(
@@ -1209,8 +1335,8 @@ def create_sample_netcdf4():
         },
         coords={
             "time": (["time"], dates, {"long_name": "Time", "standard_name": "time"}),
-            "lat": (["lat"], lat, {"long_name": "Latitude", "units": "degrees_north"}),
-            "lon": (["lon"], lon, {"long_name": "Longitude", "units": "degrees_east"}),
+            "lat": (["lat"], lat, _LAT_ATTRS),
+            "lon": (["lon"], lon, _LON_ATTRS),
         },
     )
 
@@ -1220,13 +1346,21 @@ def create_sample_netcdf4():
         "description": "Sample NetCDF4 file for testing VSCode extension",
         "institution": "Climate Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.7",
         "featureType": "timeSeries",
     }
 
-    # Save to NetCDF4
-    ds.to_netcdf(output_file, engine="netcdf4")
+    # Save to NetCDF4, compressed as a single chunk (the whole year is < 1 MB)
+    encoding = {
+        "temperature": {
+            "zlib": True,
+            "complevel": 4,
+            "shuffle": True,
+            "chunksizes": (12, 90, 180),
+        }
+    }
+    ds.to_netcdf(output_file, engine="netcdf4", encoding=encoding)
     print(f"✅ Created {output_file}")
     return output_file
 
@@ -1253,29 +1387,15 @@ def create_sample_netcdf_cdf():
     # Create time dimension
     time = np.arange(0, 12, 1)  # Monthly data
     # Convert dates to CDF_TIME_TT2000 (nanoseconds since 2000-01-01 00:00:00)
-    base_time = datetime(2000, 1, 1)
-    dates = [
-        int(
-            (
-                datetime(2020, 1, 1) + timedelta(days=int(t * 30)) - base_time
-            ).total_seconds()
-            * 1e9
-        )
-        for t in time
-    ]
+    dates = _ns_since_2000(
+        np.datetime64("2020-01-01", "ns") + (time * 30).astype("timedelta64[D]")
+    )
 
     # Create lat/lon grid
-    lat = np.linspace(-90, 90, 90)
-    lon = np.linspace(-180, 180, 180)
+    lat, lon = _global_latlon(90, 180)
 
     # Create sample climate data
-    np.random.seed(303)
-    time_3d = time[:, np.newaxis, np.newaxis]
-    temperature = (
-        15
-        + 10 * np.sin(2 * np.pi * time_3d / 12)
-        + np.random.normal(0, 2, (12, 90, 180))
-    )
+    temperature = _monthly_temperature()
 
     # Create CDF file using cdflib.cdfwrite
     import cdflib.cdfwrite
@@ -1354,7 +1474,7 @@ def create_sample_netcdf_cdf():
                 "VALIDMAX": 50.0,
                 "FILLVAL": -9999.0,
             },
-            var_data=temperature.astype(np.float32),
+            var_data=temperature,
         )
 
         # Add global attributes
@@ -1365,9 +1485,7 @@ def create_sample_netcdf_cdf():
             },
             "INSTITUTION": {0: "Climate Test Center"},
             "SOURCE": {0: "Generated for testing"},
-            "HISTORY": {
-                0: f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            },
+            "HISTORY": {0: f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}"},
         }
         cdf_file.write_globalattrs(global_attrs)
 
@@ -1392,7 +1510,7 @@ def create_sample_netcdf_netcdf():
 
     # Create time dimension
     time = np.arange(0, 6, 1)  # 6 time steps
-    dates = [datetime(2020, 1, 1) + timedelta(days=int(t * 30)) for t in time]
+    dates = np.datetime64("2020-01-01", "ns") + (time * 30).astype("timedelta64[D]")
 
     # Create lat/lon grid
     lat = np.linspace(-45, 45, 45)
@@ -1421,8 +1539,8 @@ def create_sample_netcdf_netcdf():
         },
         coords={
             "time": (["time"], dates, {"long_name": "Time", "standard_name": "time"}),
-            "lat": (["lat"], lat, {"long_name": "Latitude", "units": "degrees_north"}),
-            "lon": (["lon"], lon, {"long_name": "Longitude", "units": "degrees_east"}),
+            "lat": (["lat"], lat, _LAT_ATTRS),
+            "lon": (["lon"], lon, _LON_ATTRS),
         },
     )
 
@@ -1432,7 +1550,7 @@ def create_sample_netcdf_netcdf():
         "description": "Sample NetCDF file with .netcdf extension for testing VSCode extension",
         "institution": "Climate Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.7",
         "featureType": "timeSeries",
     }
@@ -1490,8 +1608,8 @@ def create_sample_hdf5_hdf5():
                 time,
                 {"long_name": "Time", "units": "days since 2020-01-01"},
             ),
-            "lat": (["lat"], lat, {"long_name": "Latitude", "units": "degrees_north"}),
-            "lon": (["lon"], lon, {"long_name": "Longitude", "units": "degrees_east"}),
+            "lat": (["lat"], lat, _LAT_ATTRS),
+            "lon": (["lon"], lon, _LON_ATTRS),
         },
     )
 
@@ -1501,7 +1619,7 @@ def create_sample_hdf5_hdf5():
         "description": "Sample HDF5 file with .hdf5 extension for testing VSCode extension",
         "institution": "Satellite Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
     }
 
@@ -1533,7 +1651,7 @@ def create_sample_grib_grib2():
 
     # Create time dimension
     time = np.arange(0, 12, 3)  # 3-hourly data for 12 hours
-    dates = [datetime(2020, 1, 1) + timedelta(hours=int(t)) for t in time]
+    dates = np.datetime64("2020-01-01", "ns") + time.astype("timedelta64[h]")
 
     # Create lat/lon grid
     lat = np.linspace(60, 30, 12)  # Smaller grid for GRIB2
@@ -1564,12 +1682,12 @@ def create_sample_grib_grib2():
             "latitude": (
                 ["latitude"],
                 lat,
-                {"long_name": "Latitude", "units": "degrees_north"},
+                _LAT_ATTRS,
             ),
             "longitude": (
                 ["longitude"],
                 lon,
-                {"long_name": "Longitude", "units": "degrees_east"},
+                _LON_ATTRS,
             ),
         },
     )
@@ -1580,53 +1698,53 @@ def create_sample_grib_grib2():
         "description": "Sample GRIB2 file for testing VSCode extension",
         "institution": "Weather Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
     }
 
     # Save to GRIB2 using eccodes directly
     try:
-        with open(output_file, "wb") as f:
-            for i, time_val in enumerate(dates):
-                grib_id = eccodes.codes_grib_new_from_samples("regular_ll_sfc_grib2")
-
-                try:
-                    eccodes.codes_set_string(grib_id, "shortName", "10si")
-                    eccodes.codes_set_long(
-                        grib_id, "dataDate", int(time_val.strftime("%Y%m%d"))
-                    )
-                    eccodes.codes_set_long(
-                        grib_id, "dataTime", int(time_val.strftime("%H%M"))
-                    )
-
-                    data_2d = ds["wind_speed"].isel(time=i).values
-                    if data_2d.size != eccodes.codes_get_size(grib_id, "values"):
-                        expected_size = eccodes.codes_get_size(grib_id, "values")
+        # Parse the sample message once and clone it for each time step
+        template_id = eccodes.codes_grib_new_from_samples("regular_ll_sfc_grib2")
+        try:
+            eccodes.codes_set_string(template_id, "shortName", "10si")
+            expected_size = eccodes.codes_get_size(template_id, "values")
+            padded_data = np.zeros(expected_size)
+            with open(output_file, "wb") as f:
+                for i, time_val in enumerate(dates.astype("datetime64[s]").tolist()):
+                    grib_id = eccodes.codes_clone(template_id)
+
+                    try:
+                        eccodes.codes_set_long(
+                            grib_id, "dataDate", int(time_val.strftime("%Y%m%d"))
+                        )
+                        eccodes.codes_set_long(
+                            grib_id, "dataTime", int(time_val.strftime("%H%M"))
+                        )
+
+                        data_2d = ds["wind_speed"].isel(time=i).values.ravel()
                         if data_2d.size < expected_size:
-                            padded_data = np.zeros(expected_size)
-                            padded_data[: data_2d.size] = data_2d.flatten()
+                            padded_data[: data_2d.size] = data_2d
                             data_2d = padded_data
                         else:
-                            data_2d = data_2d.flatten()[:expected_size]
-                    else:
-                        data_2d = data_2d.flatten()
+                            data_2d = data_2d[:expected_size]
 
-                    eccodes.codes_set_values(grib_id, data_2d)
-                    eccodes.codes_write(grib_id, f)
+                        eccodes.codes_set_values(grib_id, data_2d)
+                        eccodes.codes_write(grib_id, f)
 
-                finally:
-                    eccodes.codes_release(grib_id)
+                    finally:
+                        eccodes.codes_release(grib_id)
+        finally:
+            eccodes.codes_release(template_id)
 
         print(f"✅ Created {output_file} (GRIB2 format)")
 
     except Exception as e:
         print(f"  ⚠️ Error writing GRIB2 file with eccodes: {e}")
         print("  🔄 Falling back to NetCDF format with .grib2 extension")
-        temp_file = output_file.replace(".grib2", "_temp.nc")
-        ds.to_netcdf(temp_file, engine="netcdf4")
-        import shutil
-
-        shutil.move(temp_file, output_file)
+        # netCDF4 does not care about the extension: write in place, replacing any
+        # partial GRIB output
+        ds.to_netcdf(output_file, engine="netcdf4")
         print(f"✅ Created {output_file} (NetCDF format with .grib2 extension)")
 
     return output_file
@@ -1654,7 +1772,7 @@ def create_sample_grib_grb():
 
     # Create time dimension
     time = np.arange(0, 8, 2)  # 2-hourly data for 8 hours
-    dates = [datetime(2020, 1, 1) + timedelta(hours=int(t)) for t in time]
+    dates = np.datetime64("2020-01-01", "ns") + time.astype("timedelta64[h]")
 
     # Create lat/lon grid
     lat = np.linspace(50, 40, 10)
@@ -1689,12 +1807,12 @@ def create_sample_grib_grb():
             "latitude": (
                 ["latitude"],
                 lat,
-                {"long_name": "Latitude", "units": "degrees_north"},
+                _LAT_ATTRS,
             ),
             "longitude": (
                 ["longitude"],
                 lon,
-                {"long_name": "Longitude", "units": "degrees_east"},
+                _LON_ATTRS,
             ),
         },
     )
@@ -1705,53 +1823,53 @@ def create_sample_grib_grb():
         "description": "Sample GRIB file with .grb extension for testing VSCode extension",
         "institution": "Weather Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
     }
 
     # Save to GRIB using eccodes directly
     try:
-        with open(output_file, "wb") as f:
-            for i, time_val in enumerate(dates):
-                grib_id = eccodes.codes_grib_new_from_samples("regular_ll_sfc_grib2")
-
-                try:
-                    eccodes.codes_set_string(grib_id, "shortName", "r")
-                    eccodes.codes_set_long(
-                        grib_id, "dataDate", int(time_val.strftime("%Y%m%d"))
-                    )
-                    eccodes.codes_set_long(
-                        grib_id, "dataTime", int(time_val.strftime("%H%M"))
-                    )
-
-                    data_2d = ds["humidity"].isel(time=i).values
-                    if data_2d.size != eccodes.codes_get_size(grib_id, "values"):
-                        expected_size = eccodes.codes_get_size(grib_id, "values")
+        # Parse the sample message once and clone it for each time step
+        template_id = eccodes.codes_grib_new_from_samples("regular_ll_sfc_grib2")
+        try:
+            eccodes.codes_set_string(template_id, "shortName", "r")
+            expected_size = eccodes.codes_get_size(template_id, "values")
+            padded_data = np.zeros(expected_size)
+            with open(output_file, "wb") as f:
+                for i, time_val in enumerate(dates.astype("datetime64[s]").tolist()):
+                    grib_id = eccodes.codes_clone(template_id)
+
+                    try:
+                        eccodes.codes_set_long(
+                            grib_id, "dataDate", int(time_val.strftime("%Y%m%d"))
+                        )
+                        eccodes.codes_set_long(
+                            grib_id, "dataTime", int(time_val.strftime("%H%M"))
+                        )
+
+                        data_2d = ds["humidity"].isel(time=i).values.ravel()
                         if data_2d.size < expected_size:
-                            padded_data = np.zeros(expected_size)
-                            padded_data[: data_2d.size] = data_2d.flatten()
+                            padded_data[: data_2d.size] = data_2d
                             data_2d = padded_data
                         else:
-                            data_2d = data_2d.flatten()[:expected_size]
-                    else:
-                        data_2d = data_2d.flatten()
+                            data_2d = data_2d[:expected_size]
 
-                    eccodes.codes_set_values(grib_id, data_2d)
-                    eccodes.codes_write(grib_id, f)
+                        eccodes.codes_set_values(grib_id, data_2d)
+                        eccodes.codes_write(grib_id, f)
 
-                finally:
-                    eccodes.codes_release(grib_id)
+                    finally:
+                        eccodes.codes_release(grib_id)
+        finally:
+            eccodes.codes_release(template_id)
 
         print(f"✅ Created {output_file} (GRIB format)")
 
     except Exception as e:
         print(f"  ⚠️ Error writing GRIB GRB file with eccodes: {e}")
         print("  🔄 Falling back to NetCDF format with .grb extension")
-        temp_file = output_file.replace(".grb", "_temp.nc")
-        ds.to_netcdf(temp_file, engine="netcdf4")
-        import shutil
-
-        shutil.move(temp_file, output_file)
+        # netCDF4 does not care about the extension: write in place, replacing any
+        # partial GRIB output
+        ds.to_netcdf(output_file, engine="netcdf4")
         print(f"✅ Created {output_file} (NetCDF format with .grb extension)")
 
     return output_file
@@ -1779,7 +1897,7 @@ def create_sample_grib_grb2_file():
 
     # Create time dimension
     time = np.arange(0, 8, 2)  # 2-hourly data for 8 hours
-    dates = [datetime(2020, 1, 1) + timedelta(hours=int(t)) for t in time]
+    dates = np.datetime64("2020-01-01", "ns") + time.astype("timedelta64[h]")
 
     # Create lat/lon grid
     lat = np.linspace(50, 40, 10)
@@ -1814,12 +1932,12 @@ def create_sample_grib_grb2_file():
             "latitude": (
                 ["latitude"],
                 lat,
-                {"long_name": "Latitude", "units": "degrees_north"},
+                _LAT_ATTRS,
             ),
             "longitude": (
                 ["longitude"],
                 lon,
-                {"long_name": "Longitude", "units": "degrees_east"},
+                _LON_ATTRS,
             ),
         },
     )
@@ -1830,53 +1948,53 @@ def create_sample_grib_grb2_file():
         "description": "Sample GRIB file with .grb2 extension for testing VSCode extension",
         "institution": "Weather Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
     }
 
     # Save to GRIB using eccodes directly
     try:
-        with open(output_file, "wb") as f:
-            for i, time_val in enumerate(dates):
-                grib_id = eccodes.codes_grib_new_from_samples("regular_ll_sfc_grib2")
-
-                try:
-                    eccodes.codes_set_string(grib_id, "shortName", "msl")
-                    eccodes.codes_set_long(
-                        grib_id, "dataDate", int(time_val.strftime("%Y%m%d"))
-                    )
-                    eccodes.codes_set_long(
-                        grib_id, "dataTime", int(time_val.strftime("%H%M"))
-                    )
-
-                    data_2d = ds["pressure"].isel(time=i).values
-                    if data_2d.size != eccodes.codes_get_size(grib_id, "values"):
-                        expected_size = eccodes.codes_get_size(grib_id, "values")
+        # Parse the sample message once and clone it for each time step
+        template_id = eccodes.codes_grib_new_from_samples("regular_ll_sfc_grib2")
+        try:
+            eccodes.codes_set_string(template_id, "shortName", "msl")
+            expected_size = eccodes.codes_get_size(template_id, "values")
+            padded_data = np.zeros(expected_size)
+            with open(output_file, "wb") as f:
+                for i, time_val in enumerate(dates.astype("datetime64[s]").tolist()):
+                    grib_id = eccodes.codes_clone(template_id)
+
+                    try:
+                        eccodes.codes_set_long(
+                            grib_id, "dataDate", int(time_val.strftime("%Y%m%d"))
+                        )
+                        eccodes.codes_set_long(
+                            grib_id, "dataTime", int(time_val.strftime("%H%M"))
+                        )
+
+                        data_2d = ds["pressure"].isel(time=i).values.ravel()
                         if data_2d.size < expected_size:
-                            padded_data = np.zeros(expected_size)
-                            padded_data[: data_2d.size] = data_2d.flatten()
+                            padded_data[: data_2d.size] = data_2d
                             data_2d = padded_data
                         else:
-                            data_2d = data_2d.flatten()[:expected_size]
-                    else:
-                        data_2d = data_2d.flatten()
+                            data_2d = data_2d[:expected_size]
 
-                    eccodes.codes_set_values(grib_id, data_2d)
-                    eccodes.codes_write(grib_id, f)
+                        eccodes.codes_set_values(grib_id, data_2d)
+                        eccodes.codes_write(grib_id, f)
 
-                finally:
-                    eccodes.codes_release(grib_id)
+                    finally:
+                        eccodes.codes_release(grib_id)
+        finally:
+            eccodes.codes_release(template_id)
 
         print(f"✅ Created {output_file} (GRIB2 format)")
 
     except Exception as e:
         print(f"  ⚠️ Error writing GRIB GRB2 file with eccodes: {e}")
         print("  🔄 Falling back to NetCDF format with .grb2 extension")
-        temp_file = output_file.replace(".grb2", "_temp.nc")
-        ds.to_netcdf(temp_file, engine="netcdf4")
-        import shutil
-
-        shutil.move(temp_file, output_file)
+        # netCDF4 does not care about the extension: write in place, replacing any
+        # partial GRIB output
+        ds.to_netcdf(output_file, engine="netcdf4")
         print(f"✅ Created {output_file} (NetCDF format with .grb2 extension)")
 
     return output_file
@@ -1911,11 +2029,14 @@ def create_sample_geotiff_tiff():
     # Create single band data
     data = np.random.randint(0, 255, (height, width), dtype=np.uint8)
 
-    # Add spatial patterns
-    x, y = np.meshgrid(np.linspace(0, 1, width), np.linspace(0, 1, height))
-    data = np.clip(
-        data + 100 * np.sin(5 * np.pi * x) * np.cos(5 * np.pi * y), 0, 255
-    ).astype(np.uint8)
+    # Add spatial patterns, clipped in place and cast back into the uint8 band
+    x = np.linspace(0, 1, width)
+    y = np.linspace(0, 1, height)
+    pattern = np.outer(np.cos(5 * np.pi * y), np.sin(5 * np.pi * x))
+    pattern *= 100
+    pattern += data
+    np.clip(pattern, 0, 255, out=pattern)
+    data[...] = pattern
 
     # Create dataset
     ds = xr.Dataset(
@@ -1945,7 +2066,7 @@ def create_sample_geotiff_tiff():
         "description": "Sample GeoTIFF file with .tiff extension for testing VSCode extension",
         "institution": "Satellite Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
     }
 
     # Save to GeoTIFF
@@ -1985,11 +2106,14 @@ def create_sample_geotiff_geotiff():
     # Create single band data
     data = np.random.randint(0, 255, (height, width), dtype=np.uint8)
 
-    # Add spatial patterns
-    x, y = np.meshgrid(np.linspace(0, 1, width), np.linspace(0, 1, height))
-    data = np.clip(
-        data + 80 * np.sin(3 * np.pi * x) * np.cos(3 * np.pi * y), 0, 255
-    ).astype(np.uint8)
+    # Add spatial patterns, clipped in place and cast back into the uint8 band
+    x = np.linspace(0, 1, width)
+    y = np.linspace(0, 1, height)
+    pattern = np.outer(np.cos(3 * np.pi * y), np.sin(3 * np.pi * x))
+    pattern *= 80
+    pattern += data
+    np.clip(pattern, 0, 255, out=pattern)
+    data[...] = pattern
 
     # Create dataset
     ds = xr.Dataset(
@@ -2019,19 +2143,20 @@ def create_sample_geotiff_geotiff():
         "description": "Sample GeoTIFF file for testing VSCode extension",
         "institution": "Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
         "spatial_resolution": "0.1 degrees",
         "temporal_coverage": "2020-01-01",
     }
 
-    # Save to GeoTIFF
+    # Save to GeoTIFF. GDAL does not know the .geotiff extension, so the driver
+    # is explicit; without it no file is written and every run retries the build.
     try:
-        ds.rio.to_raster(output_file, compress="lzw")
+        ds.rio.to_raster(output_file, driver="GTiff", compress="lzw")
         print(f"✅ Created {output_file} (compressed GeoTIFF)")
     except Exception:
         # Fallback to uncompressed if compression fails
-        ds.rio.to_raster(output_file)
+        ds.rio.to_raster(output_file, driver="GTiff")
         print(f"✅ Created {output_file} (uncompressed GeoTIFF)")
 
     return output_file
@@ -2072,39 +2197,43 @@ def create_sample_multiband_geotiff():
     data = np.random.randint(0, 255, (n_bands, height, width), dtype=np.uint8)
 
     # Add different patterns for each band
-    x, y = np.meshgrid(np.linspace(0, 1, width), np.linspace(0, 1, height))
+    x = np.linspace(0, 1, width)
+    y = np.linspace(0, 1, height)
 
+    # Scratch buffers reused by every band: each pattern is accumulated in place
+    # and cast back into its uint8 band
+    pattern = np.empty((height, width))
+    wave = np.empty((height, width))
     for i in range(n_bands):
         # Create different patterns for each band
-        pattern = np.clip(
-            100
-            + 50 * np.sin((i + 1) * 2 * np.pi * x) * np.cos((i + 1) * 2 * np.pi * y)
-            + 30 * np.sin((i + 1) * 4 * np.pi * x) * np.cos((i + 1) * 4 * np.pi * y)
-            + np.random.normal(0, 15, (height, width)),
-            0,
-            255,
-        ).astype(np.uint8)
+        k = (i + 1) * np.pi
+        np.outer(np.cos(2 * k * y), np.sin(2 * k * x), out=pattern)
+        pattern *= 50
+        pattern += 100
+        np.outer(np.cos(4 * k * y), np.sin(4 * k * x), out=wave)
+        wave *= 30
+        pattern += wave
+        pattern += np.random.normal(0, 15, (height, width))
+        np.clip(pattern, 0, 255, out=pattern)
         data[i] = pattern
 
-    # Create separate band variables for saving as GeoTIFF
-    band_vars = {}
-    for i in range(n_bands):
-        band_name = f"band_{i + 1}"
-        band_data = data[i]  # 2D data for each band
-        band_vars[band_name] = (
-            ["y", "x"],
-            band_data,
-            {
-                "long_name": f"Band {i + 1}",
-                "units": "DN",
-                "description": f"Satellite band {i + 1} data",
-            },
-        )
-
-    # Create dataset with separate band variables
-    ds = xr.Dataset(
-        band_vars,
+    # Keep the bands stacked in a single (band, y, x) array: a Dataset with one
+    # variable per band is copied into such a stack by rioxarray before writing
+    # anyway. Band attributes are written as band tags and long names as band
+    # descriptions, the same metadata separate band variables would produce.
+    band_tags = [
+        {
+            "long_name": f"Band {i + 1}",
+            "units": "DN",
+            "description": f"Satellite band {i + 1} data",
+        }
+        for i in range(n_bands)
+    ]
+    da = xr.DataArray(
+        data,
+        dims=("band", "y", "x"),
         coords={
+            "band": np.arange(1, n_bands + 1),
             "x": (
                 ["x"],
                 np.linspace(-10, 10, width),
@@ -2119,28 +2248,30 @@ def create_sample_multiband_geotiff():
     )
 
     # Add CRS information
-    ds = ds.rio.write_crs("EPSG:3857")  # Web Mercator
+    da = da.rio.write_crs("EPSG:3857")  # Web Mercator
 
     # Add global attributes
-    ds.attrs = {
+    da.attrs = {
         "title": "Sample Multi-band GeoTIFF",
         "description": "Sample multi-band GeoTIFF file for testing band-to-variables conversion",
         "institution": "Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
         "spatial_resolution": "0.2 degrees",
         "temporal_coverage": "2020-01-01",
         "number_of_bands": n_bands,
+        "long_name": [tags["long_name"] for tags in band_tags],
+        "band_tags": band_tags,
     }
 
     # Save to GeoTIFF
     try:
-        ds.rio.to_raster(output_file, compress="lzw")
+        da.rio.to_raster(output_file, compress="lzw")
         print(f"✅ Created {output_file} (compressed multi-band GeoTIFF)")
     except Exception:
         # Fallback to uncompressed if compression fails
-        ds.rio.to_raster(output_file)
+        da.rio.to_raster(output_file)
         print(f"✅ Created {output_file} (uncompressed multi-band GeoTIFF)")
 
     return output_file
@@ -2177,11 +2308,14 @@ def create_sample_jp2_jpeg2000():
     # Create single band data
     data = np.random.randint(0, 255, (height, width), dtype=np.uint8)
 
-    # Add spatial patterns
-    x, y = np.meshgrid(np.linspace(0, 1, width), np.linspace(0, 1, height))
-    data = np.clip(
-        data + 50 * np.sin(8 * np.pi * x) * np.cos(8 * np.pi * y), 0, 255
-    ).astype(np.uint8)
+    # Add spatial patterns, clipped in place and cast back into the uint8 band
+    x = np.linspace(0, 1, width)
+    y = np.linspace(0, 1, height)
+    pattern = np.outer(np.cos(8 * np.pi * y), np.sin(8 * np.pi * x))
+    pattern *= 50
+    pattern += data
+    np.clip(pattern, 0, 255, out=pattern)
+    data[...] = pattern
 
     # Create dataset
     ds = xr.Dataset(
@@ -2211,7 +2345,7 @@ def create_sample_jp2_jpeg2000():
         "description": "Sample JPEG-2000 file with .jpeg2000 extension for testing VSCode extension",
         "institution": "Satellite Test Center",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
     }
 
     # Save to JPEG-2000
@@ -2234,7 +2368,7 @@ def create_sample_file_with_spaces():
 
     # Create time dimension
     time = np.arange(0, 5, 1)  # 5 time steps
-    dates = [datetime(2020, 1, 1) + timedelta(days=int(t)) for t in time]
+    dates = np.datetime64("2020-01-01", "ns") + time.astype("timedelta64[D]")
 
     # Create lat/lon grid
     lat = np.linspace(-30, 30, 30)
@@ -2262,8 +2396,8 @@ def create_sample_file_with_spaces():
         },
         coords={
             "time": (["time"], dates, {"long_name": "Time", "standard_name": "time"}),
-            "lat": (["lat"], lat, {"long_name": "Latitude", "units": "degrees_north"}),
-            "lon": (["lon"], lon, {"long_name": "Longitude", "units": "degrees_east"}),
+            "lat": (["lat"], lat, _LAT_ATTRS),
+            "lon": (["lon"], lon, _LON_ATTRS),
         },
     )
 
@@ -2273,7 +2407,7 @@ def create_sample_file_with_spaces():
         "description": "Test file with spaces in the filename for testing VSCode extension",
         "institution": "Test Center",
         "source": "Generated for testing filename handling",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
         "test_purpose": "filename_with_spaces",
     }
@@ -2292,8 +2426,6 @@ def cleanup_disposable_files():
         print(
             f"🧹 Cleaning up existing disposable files in {disposable_dir}/ directory..."
         )
-        import shutil
-
         shutil.rmtree(disposable_dir)
         print(f"  ✅ Cleaned up {disposable_dir}/ directory")
 
@@ -2359,12 +2491,12 @@ def create_disposable_netcdf_files():
                 "lat": (
                     ["lat"],
                     lat,
-                    {"long_name": "Latitude", "units": "degrees_north"},
+                    _LAT_ATTRS,
                 ),
                 "lon": (
                     ["lon"],
                     lon,
-                    {"long_name": "Longitude", "units": "degrees_east"},
+                    _LON_ATTRS,
                 ),
             },
         )
@@ -2375,7 +2507,7 @@ def create_disposable_netcdf_files():
             "description": f"Small disposable NetCDF file {i:02d} for testing file deletion",
             "institution": "Test Center",
             "source": "Generated for testing deletion",
-            "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
             "Conventions": "CF-1.6",
             "test_purpose": "disposable_deletion_testing",
             "file_number": i,
@@ -2456,12 +2588,12 @@ def create_disposable_zarr_files():
                 "lat": (
                     ["lat"],
                     lat,
-                    {"long_name": "Latitude", "units": "degrees_north"},
+                    _LAT_ATTRS,
                 ),
                 "lon": (
                     ["lon"],
                     lon,
-                    {"long_name": "Longitude", "units": "degrees_east"},
+                    _LON_ATTRS,
                 ),
             },
         )
@@ -2472,7 +2604,7 @@ def create_disposable_zarr_files():
             "description": f"Small disposable Zarr file {i:02d} for testing file deletion",
             "institution": "Test Center",
             "source": "Generated for testing deletion",
-            "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
             "Conventions": "CF-1.6",
             "test_purpose": "disposable_deletion_testing",
             "file_number": i,
@@ -2515,8 +2647,9 @@ def create_sample_zarr_arborescence():
     lat = np.linspace(-10, 10, 200)
     lon = np.linspace(-10, 10, 200)
 
-    # Set random seed for reproducible data
-    np.random.seed(42)
+    # Random generator for reproducible data; the noise of every group is drawn
+    # directly as float32 and scaled in place
+    rng = np.random.default_rng(42)
 
     # Create root dataset
     root_ds = xr.Dataset(
@@ -2540,7 +2673,7 @@ def create_sample_zarr_arborescence():
         "description": "Zarr file with many subgroups for testing tree navigation",
         "institution": "Test Institute",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
     }
 
     # Create DataTree structure
@@ -2551,7 +2684,7 @@ def create_sample_zarr_arborescence():
     level1_groups = ["atmosphere", "ocean", "land", "cryosphere", "biosphere"]
     for group_name in level1_groups:
         # Create small data arrays for each group
-        data = np.random.normal(0, 1, (3, 200, 200)).astype(np.float32)
+        data = rng.standard_normal((3, 200, 200), dtype=np.float32)
 
         group_ds = xr.Dataset(
             {
@@ -2574,12 +2707,12 @@ def create_sample_zarr_arborescence():
                 "lat": (
                     ["lat"],
                     lat,
-                    {"long_name": "Latitude", "units": "degrees_north"},
+                    _LAT_ATTRS,
                 ),
                 "lon": (
                     ["lon"],
                     lon,
-                    {"long_name": "Longitude", "units": "degrees_east"},
+                    _LON_ATTRS,
                 ),
             },
         )
@@ -2594,7 +2727,8 @@ def create_sample_zarr_arborescence():
         # Create level 2 subgroups for each level 1 group
         level2_groups = ["physical", "chemical", "biological"]
         for sub_group in level2_groups:
-            sub_data = np.random.normal(0, 0.5, (3, 200, 200)).astype(np.float32)
+            sub_data = rng.standard_normal((3, 200, 200), dtype=np.float32)
+            sub_data *= 0.5
 
             sub_ds = xr.Dataset(
                 {
@@ -2617,12 +2751,12 @@ def create_sample_zarr_arborescence():
                     "lat": (
                         ["lat"],
                         lat,
-                        {"long_name": "Latitude", "units": "degrees_north"},
+                        _LAT_ATTRS,
                     ),
                     "lon": (
                         ["lon"],
                         lon,
-                        {"long_name": "Longitude", "units": "degrees_east"},
+                        _LON_ATTRS,
                     ),
                 },
             )
@@ -2643,9 +2777,8 @@ def create_sample_zarr_arborescence():
                 )
 
                 for var_name in level3_groups:
-                    var_data = np.random.normal(0, 0.3, (3, 200, 200)).astype(
-                        np.float32
-                    )
+                    var_data = rng.standard_normal((3, 200, 200), dtype=np.float32)
+                    var_data *= 0.3
 
                     var_ds = xr.Dataset(
                         {
@@ -2668,12 +2801,12 @@ def create_sample_zarr_arborescence():
                             "lat": (
                                 ["lat"],
                                 lat,
-                                {"long_name": "Latitude", "units": "degrees_north"},
+                                _LAT_ATTRS,
                             ),
                             "lon": (
                                 ["lon"],
                                 lon,
-                                {"long_name": "Longitude", "units": "degrees_east"},
+                                _LON_ATTRS,
                             ),
                         },
                     )
@@ -2734,8 +2867,8 @@ def create_sample_zarr_inherited_coords():
                 time,
                 {"long_name": "Time", "units": "days since 2020-01-01"},
             ),
-            "lat": (["lat"], lat, {"long_name": "Latitude", "units": "degrees_north"}),
-            "lon": (["lon"], lon, {"long_name": "Longitude", "units": "degrees_east"}),
+            "lat": (["lat"], lat, _LAT_ATTRS),
+            "lon": (["lon"], lon, _LON_ATTRS),
         },
     )
     root_ds.attrs = {
@@ -2743,7 +2876,7 @@ def create_sample_zarr_inherited_coords():
         "description": "Zarr file demonstrating coordinate inheritance",
         "institution": "Test Institute",
         "source": "Generated for testing",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
     }
 
     # Create DataTree structure
@@ -2849,7 +2982,7 @@ def create_sample_netcdf_multiple_groups():
         rootgrp.description = "NetCDF file with multiple groups for testing"
         rootgrp.institution = "Test Institute"
         rootgrp.source = "Generated for testing"
-        rootgrp.history = f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        rootgrp.history = f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}"
         rootgrp.Conventions = "CF-1.6"
 
         # Create dimensions
@@ -3123,7 +3256,7 @@ def create_sample_netcdf_many_vars():
         "description": "Test dataset with 100+ variables and 100+ attributes for stress testing the VSCode extension",
         "institution": "Scientific Data Viewer Test Center",
         "source": "Generated for testing purposes",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.8",
         "featureType": "grid",
         "data_type": "scientific_test_data",
@@ -3162,7 +3295,7 @@ def create_sample_netcdf_many_vars():
         "processing_level": "L1",
         "processing_software": "Python xarray",
         "processing_version": "0.20.0",
-        "processing_date": datetime.now().strftime("%Y-%m-%d"),
+        "processing_date": f"{_CREATED_AT:%Y-%m-%d}",
         "processing_center": "Test Processing Center",
         "processing_algorithm": "random_generation",
         # Quality information
@@ -3464,7 +3597,7 @@ def create_sample_netcdf_long_variable_names():
         "description": "Test dataset with extremely long variable names for testing UI handling and display",
         "institution": "Scientific Data Viewer Test Center",
         "source": "Generated for testing long variable name handling",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.8",
         "featureType": "grid",
         "data_type": "test_data_long_names",
@@ -3747,7 +3880,7 @@ def create_sample_netcdf_complex_long_names():
         "description": "Test dataset with extremely long names for dimensions, coordinates, variables, and complex data types for comprehensive UI testing",
         "institution": "Scientific Data Viewer Test Center",
         "source": "Generated for testing complex long name handling",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.8",
         "featureType": "grid",
         "data_type": "complex_test_data_long_names",
@@ -4333,7 +4466,7 @@ def create_sample_netcdf_many_encoding():
         "description": "Test dataset with various encoding combinations to test CF attributes handling in the VSCode extension",
         "institution": "Scientific Data Viewer Test Center",
         "source": "Generated for testing encoding combinations",
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.8",
         "featureType": "grid",
         "data_type": "test_data_encoding",
@@ -4564,14 +4697,9 @@ def create_temporal_cdf_with_datetime_coord():
     print("📅 Creating CDF file with datetime coordinate...")
 
     # Create time dimension - 24 hours of hourly data
-    base_time = datetime(2019, 5, 10, 0, 0, 0)
-    dates = [
-        int(
-            (base_time + timedelta(hours=i) - datetime(2000, 1, 1)).total_seconds()
-            * 1e9
-        )
-        for i in range(24)
-    ]
+    dates = _ns_since_2000(
+        np.datetime64("2019-05-10", "ns") + np.arange(24).astype("timedelta64[h]")
+    )
 
     # Create sample data variables
     np.random.seed(42)
@@ -4665,13 +4793,9 @@ def create_temporal_cdf_with_datetime_data():
     print("📅 Creating CDF file with datetime data variable...")
 
     # Create time dimension - 7 days of daily data
-    base_time = datetime(2019, 5, 10, 0, 0, 0)
-    dates = [
-        int(
-            (base_time + timedelta(days=i) - datetime(2000, 1, 1)).total_seconds() * 1e9
-        )
-        for i in range(7)
-    ]
+    dates = _ns_since_2000(
+        np.datetime64("2019-05-10", "ns") + np.arange(7).astype("timedelta64[D]")
+    )
 
     # Create sample data
     np.random.seed(123)
@@ -4742,8 +4866,7 @@ def create_temporal_netcdf_with_time_coord():
     print("📅 Creating NetCDF file with time coordinate...")
 
     # Create time dimension - 48 hours of hourly data
-    base_time = datetime(2019, 5, 10, 0, 0, 0)
-    dates = [base_time + timedelta(hours=i) for i in range(48)]
+    dates = np.datetime64("2019-05-10", "ns") + np.arange(48).astype("timedelta64[h]")
 
     # Create sample data
     np.random.seed(456)
@@ -4802,7 +4925,7 @@ def create_temporal_zarr_multigroups():
 
     # Create time dimension - 12 hours of hourly data
     time = np.arange(0, 12, 1)
-    dates = [datetime(2019, 5, 10, 0, 0, 0) + timedelta(hours=int(t)) for t in time]
+    dates = np.datetime64("2019-05-10", "ns") + time.astype("timedelta64[h]")
 
     np.random.seed(789)
 
@@ -4873,11 +4996,11 @@ def create_temporal_zarr_multigroups():
         },
     )
 
-    # Create DataTree structure
-    dt = xr.DataTree(name="root")
-    dt["root"] = root_ds
-    dt["root/atmosphere"] = atm_ds
-    dt["root/ocean"] = ocean_ds
+    # Create DataTree structure in one go
+    dt = xr.DataTree.from_dict(
+        {"root": root_ds, "root/atmosphere": atm_ds, "root/ocean": ocean_ds},
+        name="root",
+    )
 
     dt.to_zarr(output_file, mode="w")
     print(f"✅ Created {output_file}")
@@ -4896,7 +5019,7 @@ def create_temporal_netcdf_datetime64():
 
     # Create time dimension using datetime64
     base_time = np.datetime64("2019-05-10T00:00:00")
-    dates = np.array([base_time + np.timedelta64(i, "h") for i in range(24)])
+    dates = base_time + np.arange(24).astype("timedelta64[h]")
 
     # Create sample data
     np.random.seed(321)
@@ -4952,23 +5075,9 @@ def create_temporal_cdf_multiple_datetime():
     print("📅 Creating CDF file with multiple datetime variables...")
 
     # Create time dimensions
-    base_time = datetime(2019, 5, 10, 0, 0, 0)
-    dates1 = [
-        int(
-            (base_time + timedelta(hours=i) - datetime(2000, 1, 1)).total_seconds()
-            * 1e9
-        )
-        for i in range(12)
-    ]
-    dates2 = [
-        int(
-            (
-                base_time + timedelta(minutes=i * 30) - datetime(2000, 1, 1)
-            ).total_seconds()
-            * 1e9
-        )
-        for i in range(24)
-    ]
+    base_time = np.datetime64("2019-05-10", "ns")
+    dates1 = _ns_since_2000(base_time + np.arange(12).astype("timedelta64[h]"))
+    dates2 = _ns_since_2000(base_time + (np.arange(24) * 30).astype("timedelta64[m]"))
 
     np.random.seed(654)
     data1 = np.random.normal(0, 1, 12)
@@ -5064,21 +5173,16 @@ def create_temporal_cdf_unordered_time():
     print("📅 Creating CDF file with unordered time variable...")
 
     # Create time dimension - 20 time points, but in random order
-    base_time = datetime(2019, 5, 10, 0, 0, 0)
     # Create ordered time points first
-    ordered_dates = [
-        int(
-            (base_time + timedelta(hours=i) - datetime(2000, 1, 1)).total_seconds()
-            * 1e9
-        )
-        for i in range(20)
-    ]
+    ordered_dates = _ns_since_2000(
+        np.datetime64("2019-05-10", "ns") + np.arange(20).astype("timedelta64[h]")
+    )
 
     # Shuffle the time points to create unordered sequence
     # But keep track of the original order for data alignment
     np.random.seed(999)  # Fixed seed for reproducibility
     shuffled_indices = np.random.permutation(20)
-    unordered_dates = [ordered_dates[i] for i in shuffled_indices]
+    unordered_dates = ordered_dates[shuffled_indices]
 
     # Create sample data variables that correspond to the original ordered time
     # When we shuffle time, we need to shuffle data in the same way
@@ -5215,7 +5319,7 @@ def create_sample_netcdf_large_4d():
     level = np.arange(level_dim)  # Months or levels
 
     # Create sample data (large 4D array)
-    np.random.seed(97)  # Seed based on issue number for reproducibility
+    rng = np.random.default_rng(97)  # Seed based on issue number for reproducibility
 
     # Create temperature-like data with some spatial and temporal patterns
     # This creates interesting visual patterns when plotted
@@ -5226,20 +5330,20 @@ def create_sample_netcdf_large_4d():
     x_pattern = np.sin(2 * np.pi * x / 360)[np.newaxis, np.newaxis, :, np.newaxis]
     level_pattern = np.exp(-level / level_dim)[np.newaxis, np.newaxis, np.newaxis, :]
 
-    # Combine patterns with noise
-    temperature = (
-        20
-        + 10 * time_pattern * y_pattern
-        + 5 * x_pattern * level_pattern
-        + np.random.normal(0, 2, (time_dim, y_dim, x_dim, level_dim))
+    # Combine patterns with noise, in place in a float32 buffer to save space
+    temperature = rng.standard_normal(
+        (time_dim, y_dim, x_dim, level_dim), dtype=np.float32
     )
+    temperature *= 2
+    temperature += (20 + 10 * time_pattern * y_pattern).astype(np.float32)
+    temperature += (5 * x_pattern * level_pattern).astype(np.float32)
 
     # Create dataset
     ds = xr.Dataset(
         {
             "temperature_4d": (
                 ["time", "y", "x", "level"],
-                temperature.astype(np.float32),  # Use float32 to save space
+                temperature,
                 {
                     "long_name": "4D Temperature Field (Large Dataset for Timeout Testing)",
                     "units": "Celsius",
@@ -5291,12 +5395,20 @@ def create_sample_netcdf_large_4d():
         "issue": "https://github.com/etienneschalk/scientific-data-viewer/issues/97",
         "purpose": "Test that resource-intensive plotting processes are properly killed on timeout",
         "total_elements": str(time_dim * y_dim * x_dim * level_dim),
-        "history": f"Created on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "history": f"Created on {_CREATED_AT:%Y-%m-%d %H:%M:%S}",
         "Conventions": "CF-1.6",
     }
 
-    # Save to file
-    ds.to_netcdf(output_file)
+    # Save to file, compressed with one chunk per time step
+    encoding = {
+        "temperature_4d": {
+            "zlib": True,
+            "complevel": 4,
+            "shuffle": True,
+            "chunksizes": (1, y_dim, x_dim, level_dim),
+        }
+    }
+    ds.to_netcdf(output_file, encoding=encoding)
 
     # Calculate file size
     file_size_mb = os.path.getsize(output_file) / (1024 * 1024)
@@ -5320,10 +5432,31 @@ def main(do_create_disposable_files: bool = False):
     created_files = []
     skipped_files = []
 
+    # The largest files (tens to hundreds of MB of generated arrays) are built in
+    # worker processes, which inherit the sample-data working directory, while
+    # the other builders run here. Results are collected in the usual order.
+    # The builders are CPU-bound, so there is no point in more workers than
+    # CPUs; four at most keeps the peak memory of the concurrent builds bounded.
+    executor = ProcessPoolExecutor(
+        max_workers=min(4, os.cpu_count() or 1),
+        initializer=_set_created_at,
+        initargs=(_CREATED_AT,),
+    )
+    netcdf_future = executor.submit(create_sample_netcdf)
+    hdf5_future = executor.submit(create_sample_hdf5)
+    zarr_future = executor.submit(create_sample_zarr_single_group_from_dataset)
+    large_4d_future = executor.submit(create_sample_netcdf_large_4d)
+    nested_zarr_future = executor.submit(
+        create_sample_zarr_with_nested_groups_from_zarr
+    )
+    datatree_zarr_future = executor.submit(
+        create_sample_zarr_with_nested_groups_from_datatree
+    )
+
     try:
         # Create sample files for all supported formats
         print("\n📁 Creating NetCDF files...")
-        netcdf_file = create_sample_netcdf()
+        netcdf_file = netcdf_future.result()
         if netcdf_file:
             created_files.append((netcdf_file, "NetCDF"))
 
@@ -5362,7 +5495,7 @@ def main(do_create_disposable_files: bool = False):
             )
 
         # Large 4D dataset for timeout testing (issue #97)
-        large_4d_netcdf_file = create_sample_netcdf_large_4d()
+        large_4d_netcdf_file = large_4d_future.result()
         if large_4d_netcdf_file:
             created_files.append(
                 (large_4d_netcdf_file, "NetCDF (Large 4D - Timeout Test)")
@@ -5377,7 +5510,7 @@ def main(do_create_disposable_files: bool = False):
             created_files.append((no_attrs_netcdf_file, "NetCDF (No Attributes)"))
 
         print("\n📁 Creating HDF5 files...")
-        hdf5_file = create_sample_hdf5()
+        hdf5_file = hdf5_future.result()
         if hdf5_file:
             created_files.append((hdf5_file, "HDF5"))
 
@@ -5449,19 +5582,19 @@ def main(do_create_disposable_files: bool = False):
             skipped_files.append("JPEG-2000 JPEG2000 (rioxarray not available)")
 
         print("\n📁 Creating Zarr files...")
-        zarr_file = create_sample_zarr_single_group_from_dataset()
+        zarr_file = zarr_future.result()
         if zarr_file:
             created_files.append((zarr_file, "Zarr"))
         else:
             skipped_files.append("Zarr (zarr not available)")
 
-        nested_zarr_file = create_sample_zarr_with_nested_groups_from_zarr()
+        nested_zarr_file = nested_zarr_future.result()
         if nested_zarr_file:
             created_files.append((nested_zarr_file, "Nested Zarr"))
         else:
             skipped_files.append("Nested Zarr (zarr not available)")
 
-        datatree_zarr_file = create_sample_zarr_with_nested_groups_from_datatree()
+        datatree_zarr_file = datatree_zarr_future.result()
         if datatree_zarr_file:
             created_files.append((datatree_zarr_file, "xr.DataTree Zarr"))
         else:
@@ -5543,6 +5676,8 @@ def main(do_create_disposable_files: bool = False):
 
         print(traceback.format_exc())
         return 1
+    finally:
+        executor.shutdown(cancel_futures=True)
 
     return 0
 
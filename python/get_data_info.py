@@ -32,19 +32,24 @@ Author: Scientific Data Viewer Extension
 import argparse
 import base64
 import datetime
+import functools
+import hashlib
+import inspect
 import io
 import itertools
 import json
 import logging
 import os
+import re
 import sys
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from dataclasses import asdict, dataclass, field, is_dataclass
 from importlib.util import find_spec
 from io import BytesIO
 from logging import Logger
 from pathlib import Path, PurePosixPath
+from stat import S_ISDIR
 from typing import (
     Any,
     Literal,
@@ -166,6 +171,22 @@ XR_HTML_OPTIONS: dict[str, Any] = {**XR_OPTIONS}
 DEFAULT_SMALL_VARIABLE_BYTES = 1000
 DEFAULT_SMALL_VALUE_DISPLAY_MAX_LEN = 500
 
+# On-disk cache of successful plot outputs (disable with CLI --no-plot-cache).
+# Entries are keyed on the plot arguments, the data file modification time and
+# the versions of the rendering code (see _plot_renderer_versions), and the least
+# recently used ones are evicted above PLOT_CACHE_MAX_BYTES.
+# The directory is per user: cached outputs are replayed as-is, so it must not be
+# shared with (nor writable by) other users, see _plot_cache_dir().
+PLOT_CACHE_DIR: Path = (
+    Path(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"))
+    / "scientific-data-viewer"
+    / "plot-cache"
+)
+PLOT_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+# Bump when the cached output changes without an extension release (e.g. in
+# development builds): entries keyed with another format never match.
+PLOT_CACHE_FORMAT: int = 1
+
 
 def _format_small_value(
     var: xr.DataArray,
@@ -337,6 +358,13 @@ DEFAULT_ENGINE_TO_FORCE_USE_OPEN_DATASET["cfgrib"] = True
 DEFAULT_ENGINE_TO_FORCE_USE_OPEN_DATASET["rasterio"] = True
 DEFAULT_ENGINE_TO_FORCE_USE_OPEN_DATASET["cdflib"] = True  # cdflib uses its own API
 
+# Older xarray versions forward unknown open_datatree kwargs to the backend, which
+# rejects generic ones such as ``cache``.
+OPEN_DATATREE_ACCEPTS_CACHE: bool = (
+    hasattr(xr, "open_datatree")
+    and "cache" in inspect.signature(xr.open_datatree).parameters
+)
+
 
 @dataclass(frozen=True)
 class FileFormatInfo:
@@ -549,9 +577,13 @@ class CreatePlotError:
     format_info: FileFormatInfo
 
 
+@functools.cache
 def check_package_availability(package_name: str) -> bool:
     """Check if a Python package is available.
 
+    Results are memoized: engine detection asks for the same packages several
+    times per invocation, and ``find_spec`` walks ``sys.path`` on each call.
+
     Parameters
     ----------
     package_name : str
@@ -562,7 +594,9 @@ def check_package_availability(package_name: str) -> bool:
     bool
         True if package is available, False otherwise
     """
-    logger.info(f"Checking package availability: {package_name}")
+    logger.info("Checking package availability: %s", package_name)
+    if package_name in sys.modules:
+        return True
     return find_spec(package_name) is not None
 
 
@@ -646,6 +680,7 @@ def open_datatree_with_fallback(
     file_path: Path,
     file_format_info: FileFormatInfo,
     convert_bands_to_variables: bool = False,
+    cache: bool = True,
 ) -> "tuple[xr.DataTree | DictOfDatasets, str]":
     """Open datatree or dataset with fallback to different engines.
 
@@ -658,6 +693,10 @@ def open_datatree_with_fallback(
         Path to the data file
     file_format_info : FileFormatInfo
         Format information for the file
+    cache : bool, optional
+        Passed to xarray's open functions. When False, values read from lazily
+        indexed variables are not kept in memory by the dataset, so reading a
+        subset never loads nor retains the whole variable.
 
     Returns
     -------
@@ -690,7 +729,7 @@ def open_datatree_with_fallback(
             xds_dict: DictOfDatasets = {"/": xds}
             return xds_dict, "cdflib"
         except Exception as exc:
-            logger.error(f"Failed to open CDF file with cdflib: {exc!r}")
+            logger.error("Failed to open CDF file with cdflib: %r", exc)
             # If cdflib fails and it's the only engine, raise the error
             if len(file_format_info.available_engines) == 1:
                 raise exc
@@ -716,7 +755,8 @@ def open_datatree_with_fallback(
             if engine == "rasterio" and convert_bands_to_variables:
                 backend_kwargs["band_as_variable"] = True
                 logger.info(
-                    f"Using band_as_variable=True for {file_format_info.extension} file"
+                    "Using band_as_variable=True for %s file",
+                    file_format_info.extension,
                 )
 
             if can_use_datatree(engine):
@@ -724,6 +764,7 @@ def open_datatree_with_fallback(
                     file_path,
                     engine=engine,
                     **DEFAULT_XR_OPEN_KWARGS[engine],
+                    **({"cache": cache} if OPEN_DATATREE_ACCEPTS_CACHE else {}),
                     backend_kwargs=backend_kwargs,
                 )
                 return xdt_or_xds, engine
@@ -752,6 +793,7 @@ def open_datatree_with_fallback(
                             file_path,
                             engine=engine,
                             **DEFAULT_XR_OPEN_KWARGS[engine],
+                            cache=cache,
                             backend_kwargs=backend_kwargs,
                         )
                         if group == "/"
@@ -759,6 +801,7 @@ def open_datatree_with_fallback(
                             file_path,
                             engine=engine,
                             **DEFAULT_XR_OPEN_KWARGS[engine],
+                            cache=cache,
                             backend_kwargs=backend_kwargs,
                             group=group,
                         )
@@ -769,13 +812,16 @@ def open_datatree_with_fallback(
         except NotImplementedError as exc:
             # Fallback on dataset
             logger.warning(
-                f"Opening file as DataTree is not implemented with engine {engine}: {exc!r}"
+                "Opening file as DataTree is not implemented with engine %s: %r",
+                engine,
+                exc,
             )
             logger.warning("Fallback to opening file as Dataset")
             xds = xr.open_dataset(
                 file_path,
                 engine=engine,
                 **DEFAULT_XR_OPEN_KWARGS[engine],
+                cache=cache,
                 backend_kwargs=DEFAULT_ENGINE_BACKEND_KWARGS[engine],
             )
             return xds, engine
@@ -787,6 +833,28 @@ def open_datatree_with_fallback(
     raise exceptions[-1]
 
 
+def close_datatree_or_datasets(
+    xds_or_xdt: "xr.DataTree | DictOfDatasets", datatree_flag: bool
+) -> None:
+    """Close what open_datatree_with_fallback opened.
+
+    Parameters
+    ----------
+    xds_or_xdt : xr.DataTree | DictOfDatasets
+        Data structure returned by open_datatree_with_fallback
+    datatree_flag : bool
+        True if xds_or_xdt is a DataTree, False if it is a DictOfDatasets
+    """
+    if datatree_flag:
+        xdt = cast("xr.DataTree", xds_or_xdt)
+        xdt.close()
+    else:
+        xds_dict = cast("DictOfDatasets", xds_or_xdt)
+        for group, xds in xds_dict.items():
+            logger.info("Close group=%r", group)
+            xds.close()
+
+
 def can_use_datatree(engine: str) -> bool:
     """Check if DataTree can be used with the given engine.
 
@@ -806,9 +874,23 @@ def can_use_datatree(engine: str) -> bool:
     )
 
 
+# Common exact spatial dimension names, checked before the regex
+SPATIAL_DIMENSION_NAMES: frozenset[str] = frozenset(
+    {"x", "y", "lon", "lat", "longitude", "latitude"}
+)
+# Case-insensitive substring match for x, y, lon(gitude), lat(itude),
+# east(ing), west(ing), north(ing) and south(ing)
+SPATIAL_DIMENSION_PATTERN: re.Pattern[str] = re.compile(
+    r"lon|lat|east|west|north|south|[xy]", re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=128)
 def is_spatial_dimension(dim_name: str) -> bool:
     """Check if a dimension name represents spatial coordinates.
 
+    Results are memoized: datasets reuse a small vocabulary of dimension names.
+
     Parameters
     ----------
     dim_name : str
@@ -819,28 +901,25 @@ def is_spatial_dimension(dim_name: str) -> bool:
     bool
         True if the dimension appears to be spatial, False otherwise
     """
-    spatial_patterns: list[str] = [
-        "x",
-        "y",
-        "lon",
-        "lat",
-        "longitude",
-        "latitude",
-        "east",
-        "west",
-        "north",
-        "south",
-        "easting",
-        "westing",
-        "northing",
-        "southing",
-    ]
-    return any(pattern in dim_name.lower() for pattern in spatial_patterns)
-
-
-def detect_plotting_strategy(
-    var: xr.DataArray,
-) -> Literal["2d_classic", "3d_col", "4d_col_row", "2d_classic_isel", "default"]:
+    if dim_name in SPATIAL_DIMENSION_NAMES:
+        return True
+    return SPATIAL_DIMENSION_PATTERN.search(dim_name) is not None
+
+
+PlottingStrategyName = Literal[
+    "2d_classic", "3d_col", "4d_col_row", "2d_classic_isel", "default"
+]
+
+# Auto plotting strategy for each number of dimensions (3D data with a single
+# leading element is special-cased as "2d_classic_isel").
+PLOTTING_STRATEGY_BY_NDIM: dict[int, PlottingStrategyName] = {
+    2: "2d_classic",
+    3: "3d_col",
+    4: "4d_col_row",
+}
+
+
+def detect_plotting_strategy(var: xr.DataArray) -> PlottingStrategyName:
     """Detect the best plotting strategy based on variable dimensions.
 
     Analyzes the variable's dimensions and shape to determine the most
@@ -861,40 +940,57 @@ def detect_plotting_strategy(
         - '4d_col_row': 4D data with spatial dimensions
         - 'default': Fallback strategy
     """
-    dims = list(var.dims)
     ndim = var.ndim
+    logger.info("Variable '%s' has %s dimensions: %s", var.name, ndim, var.dims)
 
-    logger.info(f"Variable '{var.name}' has {ndim} dimensions: {dims}")
+    # TODO eschalk for now, just use the rightmost dims as x and y
+    # (no is_spatial_dimension check on var.dims[-2:]).
+    if ndim == 3 and var.shape[0] == 1:
+        strategy = "2d_classic_isel"
+    else:
+        strategy = PLOTTING_STRATEGY_BY_NDIM.get(ndim, "default")
+    logger.info("Using plotting strategy: %s", strategy)
+    return strategy
 
-    if ndim == 2:
-        # Check if last two dimensions are spatial
-        if (
-            len(dims) >= 2
-            # TODO eschalk for now, just use the rightmost dims as x and y.
-            # and is_spatial_dimension(dims[-2])
-            # and is_spatial_dimension(dims[-1])
-        ):
-            logger.info("Using 2D spatial plotting strategy")
-            return "2d_classic"
-
-    elif ndim == 3:
-        # Check if last two dimensions are spatial
-        if (
-            len(dims) >= 2
-            # and is_spatial_dimension(dims[-2])
-            # and is_spatial_dimension(dims[-1])
-        ):
-            if var.shape[0] == 1:
-                return "2d_classic_isel"
-            else:
-                logger.info("Using 3D plotting strategy with col parameter")
-                return "3d_col"
-    elif ndim == 4 and len(dims) >= 2:
-        logger.info("Using 4D plotting strategy with col and row parameters")
-        return "4d_col_row"
 
-    logger.info("Using default plotting strategy")
-    return "default"
+# Auto strategies that render the two last dimensions of the variable as an image.
+IMAGE_PLOTTING_STRATEGIES: frozenset[str] = frozenset(
+    {"2d_classic", "2d_classic_isel", "3d_col", "4d_col_row"}
+)
+
+# Largest extent (pixels along each image axis) worth rendering: a 12 inch wide
+# figure at the 100 dpi used to save the PNG. Anything beyond is drawn sub-pixel.
+MAX_IMAGE_PIXELS_PER_DIM: int = 1200
+
+
+def _thin_image_dims(
+    var: xr.DataArray, max_pixels: int = MAX_IMAGE_PIXELS_PER_DIM
+) -> xr.DataArray:
+    """Stride the two last (image) dimensions down to at most ``max_pixels`` each.
+
+    Applied on the lazy variable, so the skipped cells are not read from disk.
+
+    Parameters
+    ----------
+    var : xr.DataArray
+        Variable about to be rendered as an image
+    max_pixels : int, optional
+        Maximum size kept along each image dimension
+
+    Returns
+    -------
+    xr.DataArray
+        ``var`` itself when no image dimension exceeds ``max_pixels``, else a thinned view
+    """
+    strides = {
+        dim: -(-var.sizes[dim] // max_pixels)
+        for dim in var.dims[-2:]
+        if var.sizes[dim] > max_pixels
+    }
+    if not strides:
+        return var
+    logger.info("Thinning image dimensions for display with strides %s", strides)
+    return var.thin(strides)
 
 
 def _parse_dimension_slice_spec(spec: str | int) -> int | slice:
@@ -938,6 +1034,11 @@ def _parse_dimension_slices(
     return out if out else None
 
 
+def _is_full_range_slice(indexer: int | slice, size: int) -> bool:
+    """True if ``indexer`` is a slice selecting every element of a dimension of ``size``."""
+    return isinstance(indexer, slice) and range(size)[indexer] == range(size)
+
+
 # --- Plot execution: kwargs bundle, dispatcher, and strategies (create_plot) ---
 
 
@@ -1058,6 +1159,98 @@ class PlotKwargsBundle:
         return self._subset_figure_kw(("aspect", "size"))
 
 
+def _image_pixel_centers(
+    dataarray: xr.DataArray, dim: Hashable
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Pixel centers along ``dim`` in axis units, for imshow extents.
+
+    Numeric coordinates are used as they are and datetime coordinates are
+    converted to matplotlib date numbers. Any other coordinate (strings, cftime
+    dates, ...) and a missing one fall back to index positions.
+
+    Returns
+    -------
+    tuple
+        Centers as floats, and the coordinate values to label index positions
+        with (None when the centers are the coordinate values themselves)
+    """
+    if dim not in dataarray.coords:
+        return np.arange(dataarray.sizes[dim], dtype=float), None
+    values = dataarray[dim].values
+    if np.issubdtype(values.dtype, np.number):
+        return values.astype(float), None
+    if np.issubdtype(values.dtype, np.datetime64):
+        import matplotlib.dates as mdates
+
+        return np.asarray(mdates.date2num(values), dtype=float), None
+    return np.arange(len(values), dtype=float), values
+
+
+def _image_extent_along(centers: np.ndarray) -> tuple[float, float]:
+    """Outer pixel edges of ``centers``, assuming they are evenly spaced (as imshow does)."""
+    step = (centers[-1] - centers[0]) / (len(centers) - 1) if len(centers) > 1 else 1.0
+    return centers[0] - step / 2, centers[-1] + step / 2
+
+
+def _format_facet_value(value: Any) -> str:
+    """Short label of a row/col coordinate value, for facet titles."""
+    if isinstance(value, np.datetime64):
+        import pandas as pd
+
+        if np.isnat(value):
+            return "NaT"
+        timestamp = pd.Timestamp(value)
+        if timestamp == timestamp.normalize():
+            return timestamp.strftime("%Y-%m-%d")
+        return str(timestamp)
+    if isinstance(value, np.timedelta64):
+        import pandas as pd
+
+        return str(pd.Timedelta(value))
+    if isinstance(value, float | np.floating):
+        return f"{value:.4g}"
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
+
+
+def _facet_color_limits(
+    values: np.ndarray,
+    vmin: float | None,
+    vmax: float | None,
+    robust: bool,
+) -> tuple[float, float, bool]:
+    """Color limits shared by every facet, following xarray's defaults.
+
+    Missing limits come from the data: its 2nd and 98th percentiles when
+    ``robust``, its extremes otherwise. Without any user-provided limit, data on
+    both sides of zero gets limits symmetric around zero.
+
+    Returns
+    -------
+    tuple
+        vmin, vmax, and whether the data is divergent (for the default colormap)
+    """
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        finite = np.zeros(1)
+    divergent = False
+    if vmin is None and vmax is None:
+        low, high = (
+            np.percentile(finite, [2, 98]) if robust else (finite.min(), finite.max())
+        )
+        divergent = bool(low < 0 < high)
+        if divergent:
+            high = max(abs(low), abs(high))
+            low = -high
+        return float(low), float(high), divergent
+    if vmin is None:
+        vmin = float(np.percentile(finite, 2) if robust else finite.min())
+    if vmax is None:
+        vmax = float(np.percentile(finite, 98) if robust else finite.max())
+    return float(vmin), float(vmax), divergent
+
+
 class XarrayPlotDispatcher:
     """Single place for DataArray.plot / .plot.imshow / .plot.hist (reduces scattered calls)."""
 
@@ -1065,6 +1258,149 @@ class XarrayPlotDispatcher:
         dataarray.plot.imshow(**_strip_add_legend_unless_hue(kwargs))
         _log_plot_route(route)
 
+    def imshow_facet_grid(
+        self,
+        dataarray: xr.DataArray,
+        route: str,
+        *,
+        row: Hashable,
+        col: Hashable,
+        **kwargs: Any,
+    ) -> None:
+        """Row/col grid of images drawn with matplotlib directly.
+
+        Same layout as ``DataArray.plot.imshow(row=..., col=...)`` (titles on the top
+        row and right margin, one shared colorbar, color limits computed once with
+        xarray's defaults, see :func:`_facet_color_limits`), without FacetGrid's
+        shared axes and tight_layout: their cost grows quadratically with the number
+        of facets and dominates large grids. Datetime and other non-numeric x/y
+        coordinates keep their values as tick labels. Honors cmap, vmin, vmax,
+        robust, size, aspect, xincrease, yincrease and add_colorbar.
+        """
+        import matplotlib.pyplot as plt
+        from matplotlib.colors import Normalize
+        from matplotlib.ticker import FuncFormatter, MaxNLocator
+        from xarray.plot.utils import label_from_attrs
+
+        dataarray = dataarray.transpose(row, col, ...)
+        y_dim, x_dim = dataarray.dims[-2:]
+        values = np.asarray(dataarray.values, dtype=float)
+        n_rows, n_cols = values.shape[:2]
+        vmin, vmax, divergent = _facet_color_limits(
+            values,
+            kwargs.get("vmin"),
+            kwargs.get("vmax"),
+            kwargs.get("robust", False),
+        )
+        norm = Normalize(vmin=vmin, vmax=vmax)
+        cmap = (
+            kwargs.get("cmap")
+            or xr.get_options()["cmap_divergent" if divergent else "cmap_sequential"]
+        )
+        finite = values[np.isfinite(values)]
+        extend_min = finite.size > 0 and finite.min() < vmin
+        extend_max = finite.size > 0 and finite.max() > vmax
+        if extend_min and extend_max:
+            extend = "both"
+        elif extend_min or extend_max:
+            extend = "min" if extend_min else "max"
+        else:
+            extend = "neither"
+
+        size = kwargs.get("size", 4)
+        aspect = kwargs.get("aspect", 1)
+        fig, axes = plt.subplots(
+            n_rows,
+            n_cols,
+            figsize=(n_cols * size * aspect, n_rows * size),
+            squeeze=False,
+        )
+        x_centers, x_categories = _image_pixel_centers(dataarray, x_dim)
+        y_centers, y_categories = _image_pixel_centers(dataarray, y_dim)
+        extent = (*_image_extent_along(x_centers), *_image_extent_along(y_centers))
+        x_edges = sorted(extent[:2])
+        y_edges = sorted(extent[2:])
+        if not kwargs.get("xincrease", True):
+            x_edges.reverse()
+        if not kwargs.get("yincrease", True):
+            y_edges.reverse()
+        x_label = (
+            label_from_attrs(dataarray[x_dim]) if x_dim in dataarray.coords else x_dim
+        )
+        y_label = (
+            label_from_attrs(dataarray[y_dim]) if y_dim in dataarray.coords else y_dim
+        )
+        row_values = dataarray[row].values if row in dataarray.coords else range(n_rows)
+        col_values = dataarray[col].values if col in dataarray.coords else range(n_cols)
+
+        def format_axis(
+            axis: Any, dim: Hashable, categories: np.ndarray | None
+        ) -> None:
+            # Datetime and categorical coordinates are drawn in date numbers and
+            # index positions: label the ticks with the coordinate values instead
+            if np.issubdtype(dataarray[dim].dtype, np.datetime64):
+                import matplotlib.dates as mdates
+
+                locator = mdates.AutoDateLocator()
+                axis.set_major_locator(locator)
+                axis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+            elif categories is not None:
+                axis.set_major_locator(MaxNLocator(nbins=6, integer=True))
+                axis.set_major_formatter(
+                    FuncFormatter(
+                        lambda position, _: (
+                            _format_facet_value(categories[round(position)])
+                            if 0 <= round(position) < len(categories)
+                            else ""
+                        )
+                    )
+                )
+
+        image = None
+        for i, row_value in enumerate(row_values):
+            for j, col_value in enumerate(col_values):
+                ax = axes[i, j]
+                image = ax.imshow(
+                    values[i, j],
+                    cmap=cmap,
+                    norm=norm,
+                    origin="lower",
+                    extent=extent,
+                    aspect="auto",
+                    interpolation="nearest",
+                )
+                ax.set_xlim(x_edges)
+                ax.set_ylim(y_edges)
+                if x_dim in dataarray.coords:
+                    format_axis(ax.xaxis, x_dim, x_categories)
+                if y_dim in dataarray.coords:
+                    format_axis(ax.yaxis, y_dim, y_categories)
+                ax.tick_params(labelbottom=i == n_rows - 1, labelleft=j == 0)
+                if i == 0:
+                    ax.set_title(f"{col} = {_format_facet_value(col_value)}")
+                if j == n_cols - 1:
+                    ax.annotate(
+                        f"{row} = {_format_facet_value(row_value)}",
+                        xy=(1.02, 0.5),
+                        xycoords="axes fraction",
+                        rotation=270,
+                        ha="left",
+                        va="center",
+                    )
+                if i == n_rows - 1:
+                    ax.set_xlabel(x_label)
+                if j == 0:
+                    ax.set_ylabel(y_label)
+
+        if image is not None and kwargs.get("add_colorbar", True):
+            fig.colorbar(
+                image,
+                ax=axes,
+                extend=extend,
+                label=label_from_attrs(dataarray),
+            )
+        _log_plot_route(route)
+
     def plot(self, dataarray: xr.DataArray, route: str, **kwargs: Any) -> None:
         if kwargs:
             dataarray.plot(**_strip_add_legend_unless_hue(kwargs))
@@ -1419,9 +1755,9 @@ class AutoFourDColRowStrategy(AutoPlottingStrategy):
         first_dim = var.dims[0]
         second_dim = var.dims[1]
         fk = bundle.auto_figure_defaults()
-        dispatcher.imshow(
+        dispatcher.imshow_facet_grid(
             var,
-            "auto:strategy=4d_col_row:DataArray.plot.imshow",
+            "auto:strategy=4d_col_row:imshow_facet_grid",
             **{
                 **bundle.imshow_kwargs(),
                 "col": second_dim,
@@ -1636,8 +1972,9 @@ def create_plot(
 
         if not file_format_info.is_supported:
             logger.error(
-                f"No engines available for {file_format_info.extension} files. "
-                f"Missing packages: {', '.join(file_format_info.missing_packages)}"
+                "No engines available for %s files. Missing packages: %s",
+                file_format_info.extension,
+                ", ".join(file_format_info.missing_packages),
             )
             return CreatePlotError(
                 error=f"No engines available for {file_format_info.extension} files. "
@@ -1657,24 +1994,32 @@ def create_plot(
 
         # Use non-interactive backend so plotting works headless (e.g. in VSCode)
         # and we avoid "Current Serial #N" / figure-manager errors from GUI backends.
-        mpl.use("Agg")
+        # Selected before pyplot is imported so no GUI toolkit (Tk/Qt) is probed.
+        # pyplot itself is still needed: xarray facet plots create their figures through it.
+        mpl.use("Agg", force=True)
         import matplotlib.pyplot as plt
 
-        # Apply matplotlib style provided by VSCode extension
+        # Apply matplotlib style provided by VSCode extension. Styles only set the
+        # rcParams they name, so start from the rc file settings: in the long-lived
+        # worker, the style of the previous request would otherwise leak into this one.
+        mpl.rc_file_defaults()
         if style and style.strip():
             try:
-                logger.info(f"Using matplotlib style: {style}")
+                logger.info("Using matplotlib style: %s", style)
                 plt.style.use(style)
             except Exception as exc:
-                logger.warning(f"Failed to apply style '{style}': {exc}, using default")
+                logger.warning(
+                    "Failed to apply style '%s': %s, using default", style, exc
+                )
                 plt.style.use("default")
         else:
             logger.info("No style specified, using default")
             plt.style.use("default")
 
-        # Open dataset with fallback
+        # Open dataset with fallback. Variables stay lazy (cache=False): only the
+        # subset left after dimension slices and time filtering is read, see var.load() below.
         xds_or_xdt, used_engine = open_datatree_with_fallback(
-            file_path, file_format_info, convert_bands_to_variables
+            file_path, file_format_info, convert_bands_to_variables, cache=False
         )
 
         datatree_flag: bool = can_use_datatree(used_engine) and isinstance(
@@ -1700,37 +2045,40 @@ def create_plot(
         if variable_name in group.data_vars or variable_name in group.coords:
             var = group[variable_name]
         else:
-            logger.error(f"Variable '{variable_name}' not found in dataset")
-            # Close Start
-            if datatree_flag:
-                xdt = cast("xr.DataTree", xds_or_xdt)
-                xdt.close()
-            else:
-                xds_dict = cast("DictOfDatasets", xds_or_xdt)
-                for group, xds in xds_dict.items():
-                    logger.info(f"Close {group=}")
-                    xds.close()
-            # Close End
+            logger.error("Variable '%s' not found in dataset", variable_name)
+            close_datatree_or_datasets(xds_or_xdt, datatree_flag)
             return CreatePlotError(
                 error=f"Variable '{variable_name}' not found in dataset",
                 format_info=file_format_info,
             )
 
-        # Apply dimension slices (Issue #117) before datetime filtering
+        # Apply dimension slices (Issue #117) before datetime filtering.
+        # var is still lazy here: integer/slice isel is pushed down to the backend
+        # array (netCDF4, h5netcdf, zarr) as a hyperslab read of the selected chunks,
+        # while keeping CF decoding (scale_factor, _FillValue, time units). There is
+        # no need for a separate raw h5py/zarr read path.
         applied_isel: dict[str, int | slice] = {}
         if dimension_slices:
             try:
                 isel_dict = _parse_dimension_slices(dimension_slices)
                 if isel_dict:
-                    # Only apply isel for dimensions that exist on this variable
-                    var_dims = set(var.dims)
-                    isel_subset = {d: v for d, v in isel_dict.items() if d in var_dims}
+                    # Only apply isel for dimensions that exist on this variable.
+                    # Full-range slices (the UI sends them for untouched sliders) are
+                    # still reported as applied, but need no isel call.
+                    applied_isel = {
+                        d: v for d, v in isel_dict.items() if d in var.sizes
+                    }
+                    isel_subset = {
+                        d: v
+                        for d, v in applied_isel.items()
+                        if not _is_full_range_slice(v, var.sizes[d])
+                    }
                     if isel_subset:
                         var = var.isel(isel_subset)
-                        applied_isel = dict(isel_subset)
-                        logger.info(f"Applied dimension slices: {applied_isel}")
+                    if applied_isel:
+                        logger.info("Applied dimension slices: %s", applied_isel)
             except ValueError as e:
-                logger.warning(f"Dimension slice parse error: {e}")
+                logger.warning("Dimension slice parse error: %s", e)
                 return CreatePlotError(
                     error=f"Invalid dimension slice: {e}",
                     format_info=file_format_info,
@@ -1783,7 +2131,7 @@ def create_plot(
                     and datetime_var_name not in datetime_group.data_vars
                 ):
                     logger.error(
-                        f"Datetime variable '{datetime_var_name}' not found in dataset"
+                        "Datetime variable '%s' not found in dataset", datetime_var_name
                     )
                     return CreatePlotError(
                         error=f"Datetime variable '{datetime_var_name}' not found in dataset",
@@ -1815,9 +2163,13 @@ def create_plot(
                     else:
                         # No common dimensions - cannot use this datetime variable for plotting
                         logger.warning(
-                            f"Datetime variable '{datetime_var_name}' does not share any dimensions "
-                            f"with variable '{variable_name}'. Cannot use for plotting. "
-                            f"Variable dimensions: {var.dims}, datetime dimensions: {datetime_var.dims}"
+                            "Datetime variable '%s' does not share any dimensions "
+                            "with variable '%s'. Cannot use for plotting. "
+                            "Variable dimensions: %s, datetime dimensions: %s",
+                            datetime_var_name,
+                            variable_name,
+                            var.dims,
+                            datetime_var.dims,
                         )
                         datetime_var = None
                 else:
@@ -1830,8 +2182,9 @@ def create_plot(
                         if monotonicity == "non_monotonic":
                             # Fall back to boolean indexing for non-monotonic data
                             logger.info(
-                                f"Datetime variable '{datetime_var_name}' is not monotonic. "
-                                f"Using boolean indexing instead of .sel() with slice."
+                                "Datetime variable '%s' is not monotonic. "
+                                "Using boolean indexing instead of .sel() with slice.",
+                                datetime_var_name,
                             )
                             # Find common dimension
                             common_dims = set(var.dims) & set(datetime_var.dims)
@@ -1854,8 +2207,10 @@ def create_plot(
                                     datetime_var = datetime_var.isel({dim_name: mask})
                             else:
                                 logger.warning(
-                                    f"Datetime variable '{datetime_var_name}' does not share any dimensions "
-                                    f"with variable '{variable_name}'. Cannot use for plotting."
+                                    "Datetime variable '%s' does not share any dimensions "
+                                    "with variable '%s'. Cannot use for plotting.",
+                                    datetime_var_name,
+                                    variable_name,
                                 )
                                 datetime_var = None
                         else:
@@ -1863,8 +2218,9 @@ def create_plot(
                             # For monotonic decreasing, swap start and end times
                             if monotonicity == "decreasing":
                                 logger.info(
-                                    f"Datetime variable '{datetime_var_name}' is monotonic decreasing. "
-                                    f"Swapping start and end times for slice."
+                                    "Datetime variable '%s' is monotonic decreasing. "
+                                    "Swapping start and end times for slice.",
+                                    datetime_var_name,
                                 )
                                 slice_start = end_ts
                                 slice_end = start_ts
@@ -1904,15 +2260,19 @@ def create_plot(
                         else:
                             # No common dimensions - cannot use this datetime variable for plotting
                             logger.warning(
-                                f"Datetime variable '{datetime_var_name}' is a coordinate in a different group "
-                                f"and does not share any dimensions with variable '{variable_name}'. "
-                                f"Cannot use for plotting. "
-                                f"Variable dimensions: {var.dims}, datetime dimensions: {datetime_var.dims}"
+                                "Datetime variable '%s' is a coordinate in a different group "
+                                "and does not share any dimensions with variable '%s'. "
+                                "Cannot use for plotting. "
+                                "Variable dimensions: %s, datetime dimensions: %s",
+                                datetime_var_name,
+                                variable_name,
+                                var.dims,
+                                datetime_var.dims,
                             )
                             datetime_var = None
 
             except Exception as exc:
-                logger.error(f"Error processing datetime variable: {exc!r}")
+                logger.error("Error processing datetime variable: %r", exc)
                 return CreatePlotError(
                     error=f"Error processing datetime variable: {exc!r}",
                     format_info=file_format_info,
@@ -1933,6 +2293,19 @@ def create_plot(
             or (size is not None and size > 0)
         )
 
+        # Auto image plots: drop the resolution that cannot be displayed before reading
+        strategy = None
+        if not user_provided:
+            strategy = detect_plotting_strategy(var)
+            if strategy in IMAGE_PLOTTING_STRATEGIES:
+                var = _thin_image_dims(var)
+
+        # Read the selected subset once: plotting accesses the values several times
+        # (color limits, facets), which would otherwise hit the file on every access.
+        var = var.load()
+        if datetime_var is not None:
+            datetime_var = datetime_var.load()
+
         # Optional plot kwargs (e.g. bins for histogram, robust, xincrease, yincrease, aspect, size)
         logger.info(
             "Plot params received: row=%r, col=%r, plot_x=%r, plot_y=%r, plot_hue=%r, "
@@ -2004,7 +2377,6 @@ def create_plot(
                     plot_hue=plot_hue,
                 )
             else:
-                strategy = detect_plotting_strategy(var)
                 default_ctx = AutoDefaultPlotContext(
                     datetime_var=datetime_var,
                     datetime_var_display_name=datetime_var_display_name,
@@ -2043,24 +2415,19 @@ def create_plot(
                         f"End Time: {end_datetime} ({datetime_var_name})"
                     )
 
-            plt.suptitle("\n".join(suptitle_lines), y=1.20)
+            # Work on the Figure object (backed by the Agg canvas) rather than
+            # pyplot's global state machine
+            fig = plt.gcf()
+            fig.suptitle("\n".join(suptitle_lines), y=1.20)
             # Convert to base64 string
             buffer = BytesIO()
-            plt.savefig(buffer, format="png", dpi=100, bbox_inches="tight")
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
+            fig.savefig(buffer, format="png", dpi=100, bbox_inches="tight")
+            # getbuffer() is a view on the BytesIO storage: no copy of the PNG bytes
+            with buffer.getbuffer() as png_view:
+                image_base64 = base64.b64encode(png_view).decode("ascii")
             plt.close("all")
 
-        # Close Start
-        if datatree_flag:
-            xdt: xr.DataTree = cast("xr.DataTree", xds_or_xdt)
-            xdt.close()
-        else:
-            xds_dict: DictOfDatasets = cast("DictOfDatasets", xds_or_xdt)
-            for group, xds in xds_dict.items():
-                logger.info(f"Close {group=}")
-                xds.close()
-        # Close End
+        close_datatree_or_datasets(xds_or_xdt, datatree_flag)
 
         logger.info("Plot created successfully")
         # Serialize isel kwargs for result (slice -> str for JSON)
@@ -2078,7 +2445,11 @@ def create_plot(
 
     except Exception as exc:
         logger.error(
-            f"Error creating plot: {exc!r} ({file_path=} {variable_path=} {plot_type=})"
+            "Error creating plot: %r (file_path=%r variable_path=%r plot_type=%r)",
+            exc,
+            file_path,
+            variable_path,
+            plot_type,
         )
         return CreatePlotError(
             error=f"Error creating plot: {exc!r} ({file_path=} {variable_path=} {plot_type=})",
@@ -2159,7 +2530,7 @@ def get_file_info(
                 sorted(xdt.to_dict().items(), key=lambda x: x[0])
             )
             logger.info(
-                f"Processing DataTree with {len(flat_dict_of_xds.keys())} groups"
+                "Processing DataTree with %s groups", len(flat_dict_of_xds.keys())
             )
         else:
             xds_dict: DictOfDatasets = cast("DictOfDatasets", xds_or_xdt)
@@ -2188,11 +2559,11 @@ def get_file_info(
                             for group, xds in xds_dict.items()
                         )
                     )
-            logger.info(f"{xds_dict=}")
+            logger.info("xds_dict=%r", xds_dict)
 
             flat_dict_of_xds: DictOfDatasets = xds_dict
             logger.info(
-                f"Processing DictOfDatasets with {len(flat_dict_of_xds.keys())} groups"
+                "Processing DictOfDatasets with %s groups", len(flat_dict_of_xds.keys())
             )
 
         info = FileInfoResult(
@@ -2212,7 +2583,7 @@ def get_file_info(
         )
 
         for group in flat_dict_of_xds:
-            logger.info(f"Processing group: {group}")
+            logger.info("Processing group: %s", group)
             # logger.info(f"{flat_dict_of_xds[group]=}")
             xds = flat_dict_of_xds[group]
 
@@ -2240,7 +2611,10 @@ def get_file_info(
                 # Check if coordinate is a datetime variable
                 if is_datetime_variable(coord):
                     logger.info(
-                        f"Found datetime coordinate: {group}/{coord_name} (dtype: {coord.dtype})"
+                        "Found datetime coordinate: %s/%s (dtype: %s)",
+                        group,
+                        coord_name,
+                        coord.dtype,
                     )
                     # Compute min and max values
                     try:
@@ -2255,7 +2629,9 @@ def get_file_info(
                             max_val = None
                     except Exception as exc:
                         logger.warning(
-                            f"Could not compute min/max for datetime coordinate {coord_name}: {exc!r}"
+                            "Could not compute min/max for datetime coordinate %s: %r",
+                            coord_name,
+                            exc,
                         )
                         min_val = None
                         max_val = None
@@ -2277,14 +2653,20 @@ def get_file_info(
                     small_value_display_max_len=small_value_display_max_len,
                 )
                 logger.info(
-                    f"Processing group and var: {group=}  {var_name=} {var_info=}"
+                    "Processing group and var: group=%r  var_name=%r var_info=%r",
+                    group,
+                    var_name,
+                    var_info,
                 )
 
                 info.variables_flattened.setdefault(group, []).append(var_info)
                 # Check if data variable is a datetime variable
                 if is_datetime_variable(var):
                     logger.info(
-                        f"Found datetime data variable: {group}/{var_name} (dtype: {var.dtype})"
+                        "Found datetime data variable: %s/%s (dtype: %s)",
+                        group,
+                        var_name,
+                        var.dtype,
                     )
                     # Compute min and max values
                     try:
@@ -2299,7 +2681,9 @@ def get_file_info(
                             max_val = None
                     except Exception as exc:
                         logger.warning(
-                            f"Could not compute min/max for datetime variable {var_name}: {exc!r}"
+                            "Could not compute min/max for datetime variable %s: %r",
+                            var_name,
+                            exc,
                         )
                         min_val = None
                         max_val = None
@@ -2323,21 +2707,12 @@ def get_file_info(
             info.xarray_html_repr_flattened[group] = repr_html
             info.xarray_text_repr_flattened[group] = repr_text
 
-        # Close Start
-        if datatree_flag:
-            xdt: xr.DataTree = cast("xr.DataTree", xds_or_xdt)
-            xdt.close()
-        else:
-            xds_dict: DictOfDatasets = cast("DictOfDatasets", xds_or_xdt)
-            for group, xds in xds_dict.items():
-                logger.info(f"Close {group=}")
-                xds.close()
-        # Close End
+        close_datatree_or_datasets(xds_or_xdt, datatree_flag)
 
-        logger.info(f"Detected datetime variables: {info.datetime_variables}")
+        logger.info("Detected datetime variables: %s", info.datetime_variables)
         return info
     except Exception as exc:
-        logger.info(f"Error getting file info: {exc!r}")
+        logger.info("Error getting file info: %r", exc)
         # Handle other errors (file corruption, format issues, etc.)
         error = FileInfoError(
             error=str(exc),
@@ -2521,11 +2896,201 @@ def create_coord_info(
     )
 
 
-def main() -> int:
-    """Main entry point for the script.
+def _directory_store_mtime_ns(store_path: Path, variable_path: str) -> int:
+    """Return the newest modification time of what a plot of a directory store reads.
 
-    Parses command line arguments and executes the appropriate mode
-    (info or plot) based on user input.
+    Rewriting a chunk in place only touches that chunk file, not the metadata
+    at the root of the store. The scan therefore covers the top-level entries,
+    the metadata files (``zarr.json``, ``.zarray``, ``.zattrs``, ...) of each
+    group on the way to the variable, and every file under the array directory
+    of the variable.
+
+    Parameters
+    ----------
+    store_path : Path
+        Root directory of the store
+    variable_path : str
+        Path of the plotted variable inside the store, e.g. ``/group/var``
+
+    Returns
+    -------
+    int
+        Newest modification time in nanoseconds
+
+    Raises
+    ------
+    OSError
+        If the store root cannot be stat-ed
+    """
+    mtimes = [store_path.stat().st_mtime_ns]
+    with os.scandir(store_path) as entries:
+        mtimes.extend(entry.stat().st_mtime_ns for entry in entries)
+
+    parts = PurePosixPath("/", variable_path).parts[1:]
+    group_path = store_path
+    for part in parts[:-1]:
+        group_path = group_path / part
+        if not group_path.is_dir():
+            break
+        with os.scandir(group_path) as entries:
+            mtimes.extend(
+                entry.stat().st_mtime_ns for entry in entries if entry.is_file()
+            )
+
+    for root, _, files in os.walk(store_path.joinpath(*parts)):
+        mtimes.append(os.stat(root).st_mtime_ns)
+        mtimes.extend(os.stat(os.path.join(root, name)).st_mtime_ns for name in files)
+    return max(mtimes)
+
+
+@functools.cache
+def _plot_renderer_versions() -> dict[str, str]:
+    """Versions of the code that renders plots: extension and plotting libraries.
+
+    Part of the plot cache key, so that cached plots are not replayed after an
+    upgrade changes how plots are drawn. The extension version is read from the
+    ``package.json`` shipped next to the ``python`` directory.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions: dict[str, str] = {}
+    try:
+        package_json = Path(__file__).resolve().parent.parent / "package.json"
+        versions["extension"] = str(
+            json.loads(package_json.read_text(encoding="utf-8"))["version"]
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        versions["extension"] = "unknown"
+    for package in ("matplotlib", "xarray", "numpy"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = "unknown"
+    return versions
+
+
+def _plot_cache_key(args: argparse.Namespace) -> str | None:
+    """Return the plot cache key for parsed CLI arguments.
+
+    The key covers every plot argument plus the modification time of the data
+    file. For directory stores (Zarr), it is the newest modification time of
+    the files read for the plotted variable, see :func:`_directory_store_mtime_ns`.
+    It also covers PLOT_CACHE_FORMAT and :func:`_plot_renderer_versions`.
+
+    Returns
+    -------
+    str or None
+        Hex digest, or None when the data file cannot be stat-ed (no caching)
+    """
+    try:
+        file_path = args.file_path.resolve()
+        mtime_ns = file_path.stat().st_mtime_ns
+        if file_path.is_dir():
+            mtime_ns = _directory_store_mtime_ns(file_path, args.variable_name)
+    except OSError:
+        return None
+    payload = json.dumps(
+        [
+            PLOT_CACHE_FORMAT,
+            _plot_renderer_versions(),
+            str(file_path),
+            mtime_ns,
+            vars(args),
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _plot_cache_dir(create: bool = False) -> Path | None:
+    """Return the plot cache directory, or None when it must not be used.
+
+    The directory is created private to the current user (mode 0o700). An
+    existing directory is refused if it is not a real directory or, on POSIX,
+    if another user owns it or may access it.
+
+    Parameters
+    ----------
+    create : bool, default False
+        Create the directory if it does not exist yet
+    """
+    try:
+        if create:
+            PLOT_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        dir_stat = PLOT_CACHE_DIR.lstat()
+    except OSError as exc:
+        if create:
+            logger.warning("Could not create plot cache directory: %r", exc)
+        return None
+    if not S_ISDIR(dir_stat.st_mode) or (
+        hasattr(os, "getuid")
+        and (dir_stat.st_uid != os.getuid() or dir_stat.st_mode & 0o077)
+    ):
+        logger.warning(
+            "Not using plot cache directory %s: it must be a directory private "
+            "to the current user",
+            PLOT_CACHE_DIR,
+        )
+        return None
+    return PLOT_CACHE_DIR
+
+
+def _read_plot_cache(key: str) -> str | None:
+    """Return the cached plot output for ``key``, or None on a cache miss."""
+    cache_dir = _plot_cache_dir()
+    if cache_dir is None:
+        return None
+    cache_file = cache_dir / f"{key}.json"
+    try:
+        output = cache_file.read_text(encoding="utf-8")
+        # Refresh the modification time: eviction drops the least recently used
+        os.utime(cache_file)
+    except OSError:
+        return None
+    return output
+
+
+def _write_plot_cache(key: str, output: str) -> None:
+    """Store a plot output atomically, then evict old entries over the size limit.
+
+    Failures are logged and ignored: the cache is only an optimization.
+    """
+    cache_dir = _plot_cache_dir(create=True)
+    if cache_dir is None:
+        return
+    try:
+        cache_file = cache_dir / f"{key}.json"
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(output, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+
+        entries = [(entry, entry.stat()) for entry in cache_dir.glob("*.json")]
+        total_bytes = sum(stat.st_size for _, stat in entries)
+        for entry, stat in sorted(entries, key=lambda item: item[1].st_mtime_ns):
+            if total_bytes <= PLOT_CACHE_MAX_BYTES:
+                break
+            entry.unlink(missing_ok=True)
+            total_bytes -= stat.st_size
+    except OSError as exc:
+        logger.warning("Could not write plot cache: %r", exc)
+
+
+def run_cli(argv: list[str] | None = None) -> tuple[str, int]:
+    """Parse command line arguments and execute the requested mode.
+
+    Shared by :func:`main` and the long-lived ``worker.py`` process, which feeds
+    the same argument vectors over stdin instead of spawning one interpreter per call.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Arguments without the program name. Defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    tuple
+        Tuple containing (json_output, exit_code)
     """
     parser = argparse.ArgumentParser(
         description="Get data file information and create plots from data file variables",
@@ -2708,6 +3273,12 @@ Examples:
         help="Request a legend when xarray supports it (e.g. with hue); ignored for imshow without hue",
     )
 
+    parser.add_argument(
+        "--no-plot-cache",
+        action="store_true",
+        help="Always render the plot instead of reusing a cached result for unchanged files and arguments",
+    )
+
     parser.add_argument(
         "--small-variable-bytes",
         type=int,
@@ -2722,16 +3293,17 @@ Examples:
         help="Max character length for displayed small variable/coordinate values (truncation).",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate arguments based on mode
     if args.mode not in mode_choices:
-        print(to_json_best_effort({"error": f"Invalid mode: {args.mode}"}))
-        return 1
+        return to_json_best_effort({"error": f"Invalid mode: {args.mode}"}), 1
 
     if args.mode == "plot" and not args.variable_name:
-        print(to_json_best_effort({"error": "Variable name is required for plot mode"}))
-        return 1
+        return (
+            to_json_best_effort({"error": "Variable name is required for plot mode"}),
+            1,
+        )
 
     # Dispatch based on mode
     if args.mode == "info":
@@ -2745,17 +3317,25 @@ Examples:
         ok = isinstance(result, FileInfoResult)
 
     elif args.mode == "plot":
+        cache_key = None
+        if not args.no_plot_cache:
+            cache_key = _plot_cache_key(args)
+            cached_output = _read_plot_cache(cache_key) if cache_key else None
+            if cached_output is not None:
+                logger.info("Plot served from cache (%s)", cache_key)
+                return cached_output, 0
+
         dimension_slices_dict = None
         if args.dimension_slices and args.dimension_slices.strip():
             try:
                 dimension_slices_dict = json.loads(args.dimension_slices)
             except json.JSONDecodeError as e:
-                print(
+                return (
                     to_json_best_effort(
                         {"error": f"Invalid --dimension-slices JSON: {e}"}
-                    )
+                    ),
+                    1,
                 )
-                return 1
         # Parse xincrease/yincrease from CLI ('true'/'false' strings)
         xincrease_arg = None
         if args.xincrease is not None:
@@ -2795,10 +3375,23 @@ Examples:
         )
         ok = isinstance(result, CreatePlotResult)
 
-    # Log and print result
-    logger.info(f"{args.mode} Result: {result}")
-    print(to_json_best_effort({"result" if ok else "error": asdict(result)}))
-    return 0
+    # Log and return result
+    logger.info("%s Result: %s", args.mode, result)
+    output = to_json_best_effort({"result" if ok else "error": asdict(result)})
+    if args.mode == "plot" and ok and cache_key:
+        _write_plot_cache(cache_key, output)
+    return output, 0
+
+
+def main() -> int:
+    """Main entry point for the script.
+
+    Parses command line arguments and executes the appropriate mode
+    (info or plot) based on user input.
+    """
+    output, exit_code = run_cli()
+    print(output)
+    return exit_code
 
 
 if __name__ == "__main__":
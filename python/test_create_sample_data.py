@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the array builders of create_sample_data.py.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+import create_sample_data
+
+
+class TestSeasonalField:
+    """Test _seasonal_field."""
+
+    def test_numba_kernel_matches_numpy_path(self, monkeypatch):
+        pytest.importorskip("numba")
+        assert create_sample_data._scale_and_add_seasonal is not None
+        arguments = ((7, 3, 5), 15.0, 10.0, 3.5, 2.0)
+
+        compiled = create_sample_data._seasonal_field(
+            np.random.default_rng(0), *arguments
+        )
+        monkeypatch.setattr(create_sample_data, "_scale_and_add_seasonal", None)
+        expected = create_sample_data._seasonal_field(
+            np.random.default_rng(0), *arguments
+        )
+
+        assert compiled.dtype == expected.dtype == np.float32
+        np.testing.assert_array_equal(compiled, expected)
+
+    def test_numpy_path(self, monkeypatch):
+        monkeypatch.setattr(create_sample_data, "_scale_and_add_seasonal", None)
+        field = create_sample_data._seasonal_field(
+            np.random.default_rng(0), (4, 2), 1.0, 2.0, 4.0, 0.0
+        )
+        assert field.dtype == np.float32
+        np.testing.assert_allclose(
+            field, np.repeat([[1.0], [3.0], [1.0], [-1.0]], 2, axis=1), atol=1e-6
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,18 +4,22 @@ Unit tests for dimension slice parsing (Issue #117), small value display (Issue
 and plot x/y/hue kwargs.
 """
 
+import json
 import subprocess
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 import xarray as xr
 
 sys.path.insert(0, str(Path(__file__).parent))
 from get_data_info import (
     _format_small_value,
+    _is_full_range_slice,
     _parse_dimension_slice_spec,
     _parse_dimension_slices,
+    run_cli,
 )
 
 
@@ -98,6 +102,48 @@ class TestParseDimensionSlices:
         assert out["c"] == slice(0, 12, 3)
 
 
+class TestIsFullRangeSlice:
+    """Test _is_full_range_slice (no-op slices skipped before isel)."""
+
+    def test_full_range_slices(self):
+        assert _is_full_range_slice(slice(None), 10)
+        assert _is_full_range_slice(slice(0, 10), 10)
+        assert _is_full_range_slice(slice(0, 100), 10)
+        assert _is_full_range_slice(slice(-10, None, 1), 10)
+
+    def test_partial_slices_and_ints(self):
+        assert not _is_full_range_slice(slice(1, 10), 10)
+        assert not _is_full_range_slice(slice(0, 9), 10)
+        assert not _is_full_range_slice(slice(None, None, 2), 10)
+        assert not _is_full_range_slice(0, 1)
+
+
+class TestAppliedDimensionSlices:
+    """Test the dimension slices reported in the plot result."""
+
+    def test_full_range_slices_are_reported(self, tmp_path):
+        file_path = tmp_path / "cube.nc"
+        xr.Dataset(
+            {"t": (("time", "lat", "lon"), np.arange(60.0).reshape(4, 3, 5))}
+        ).to_netcdf(file_path)
+        output, exit_code = run_cli(
+            [
+                "plot",
+                str(file_path),
+                "/t",
+                "--no-plot-cache",
+                "--dimension-slices",
+                json.dumps({"time": 1, "lat": "0:3", "lon": "1:4", "other": "0:2"}),
+            ]
+        )
+        assert exit_code == 0, output
+        assert json.loads(output)["result"]["applied_isel_kwargs"] == {
+            "time": 1,
+            "lat": str(slice(0, 3)),
+            "lon": str(slice(1, 4)),
+        }
+
+
 class TestFormatSmallValue:
     """Test _format_small_value (Issue #102) for display of small variable values."""
 
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the row/col image grid drawn by XarrayPlotDispatcher.imshow_facet_grid.
+"""
+
+import sys
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+sys.path.insert(0, str(Path(__file__).parent))
+from get_data_info import XarrayPlotDispatcher, _facet_color_limits
+
+
+@pytest.fixture
+def figure():
+    yield
+    plt.close("all")
+
+
+def _draw(dataarray, **kwargs):
+    XarrayPlotDispatcher().imshow_facet_grid(
+        dataarray,
+        "test:imshow_facet_grid",
+        row=dataarray.dims[0],
+        col=dataarray.dims[1],
+        **kwargs,
+    )
+    fig = plt.gcf()
+    image_axes = [ax for ax in fig.axes if ax.images]
+    colorbars = [ax for ax in fig.axes if not ax.images]
+    return fig, image_axes, colorbars
+
+
+def _four_d(values, coords):
+    return xr.DataArray(
+        values,
+        dims=("level", "time", "lat", "lon"),
+        coords=coords,
+        name="temperature",
+        attrs={"units": "K"},
+    )
+
+
+@pytest.mark.usefixtures("figure")
+class TestImshowFacetGrid:
+    """Test imshow_facet_grid layout, labels and colors."""
+
+    def test_numeric_coordinates(self):
+        dataarray = _four_d(
+            np.arange(2 * 3 * 4 * 5, dtype=float).reshape(2, 3, 4, 5),
+            {
+                "level": [1000.0, 850.0],
+                "time": [0.5, 1.5, 2.5],
+                "lat": [10.0, 20.0, 30.0, 40.0],
+                "lon": [0.0, 1.0, 2.0, 3.0, 4.0],
+            },
+        )
+        _, image_axes, colorbars = _draw(dataarray)
+
+        assert len(image_axes) == 6
+        assert [ax.get_title() for ax in image_axes[:3]] == [
+            "time = 0.5",
+            "time = 1.5",
+            "time = 2.5",
+        ]
+        row_labels = [
+            child.get_text()
+            for ax in image_axes
+            for child in ax.texts
+            if child.get_text().startswith("level")
+        ]
+        assert row_labels == ["level = 1000", "level = 850"]
+        assert image_axes[0].get_xlim() == (-0.5, 4.5)
+        assert image_axes[0].get_ylim() == (5.0, 45.0)
+        assert image_axes[-1].get_xlabel() == "lon"
+        assert image_axes[0].get_ylabel() == "lat"
+
+        (colorbar_ax,) = colorbars
+        assert colorbar_ax.get_ylabel() == "temperature [K]"
+        assert image_axes[0].images[0].norm.vmin == 0.0
+        assert image_axes[0].images[0].norm.vmax == 119.0
+        assert image_axes[0].images[0].get_cmap().name == "viridis"
+
+    def test_datetime_coordinates(self):
+        times = pd.date_range("2024-01-01", periods=3, freq="D")
+        dataarray = _four_d(
+            np.random.default_rng(0).random((2, 3, 4, 6)),
+            {
+                "level": [1000.0, 850.0],
+                "time": times,
+                "lat": [10.0, 20.0, 30.0, 40.0],
+                "lon": pd.date_range("2024-02-01", periods=6, freq="h"),
+            },
+        )
+        fig, image_axes, colorbars = _draw(dataarray)
+        fig.canvas.draw()
+
+        assert [ax.get_title() for ax in image_axes[:3]] == [
+            "time = 2024-01-01",
+            "time = 2024-01-02",
+            "time = 2024-01-03",
+        ]
+        # The x axis is in date numbers with date tick labels, not index positions
+        low, high = image_axes[0].get_xlim()
+        half_hour = 1 / 48
+        assert low == pytest.approx(
+            mdates.date2num(np.datetime64("2024-02-01T00:00")) - half_hour
+        )
+        assert high == pytest.approx(
+            mdates.date2num(np.datetime64("2024-02-01T05:00")) + half_hour
+        )
+        tick_labels = [label.get_text() for label in image_axes[-1].get_xticklabels()]
+        assert any(":00" in label for label in tick_labels)
+        assert len(colorbars) == 1
+
+    def test_categorical_coordinate_labels(self):
+        dataarray = _four_d(
+            np.zeros((1, 2, 3, 4)),
+            {"lon": ["a", "b", "c", "d"]},
+        )
+        fig, image_axes, _ = _draw(dataarray)
+        fig.canvas.draw()
+
+        tick_labels = [label.get_text() for label in image_axes[0].get_xticklabels()]
+        assert set(tick_labels) - {""} <= {"a", "b", "c", "d"}
+        assert "a" in tick_labels
+        assert [ax.get_title() for ax in image_axes] == ["time = 0", "time = 1"]
+
+    def test_divergent_data_and_no_colorbar(self):
+        dataarray = _four_d(
+            np.linspace(-1.0, 3.0, 16).reshape(2, 2, 2, 2),
+            {},
+        )
+        _, image_axes, colorbars = _draw(dataarray, add_colorbar=False)
+
+        assert not colorbars
+        norm = image_axes[0].images[0].norm
+        assert (norm.vmin, norm.vmax) == (-3.0, 3.0)
+        assert image_axes[0].images[0].get_cmap().name == "RdBu_r"
+
+
+class TestFacetColorLimits:
+    """Test _facet_color_limits."""
+
+    def test_extremes(self):
+        assert _facet_color_limits(np.array([1.0, 5.0, np.nan]), None, None, False) == (
+            1.0,
+            5.0,
+            False,
+        )
+
+    def test_robust_uses_percentiles(self):
+        values = np.arange(101.0)
+        assert _facet_color_limits(values, None, None, True) == (2.0, 98.0, False)
+
+    def test_user_limits_are_kept(self):
+        values = np.arange(-5.0, 6.0)
+        assert _facet_color_limits(values, -1.0, None, False) == (-1.0, 5.0, False)
+
+    def test_all_nan(self):
+        assert _facet_color_limits(np.full(3, np.nan), None, None, False) == (
+            0.0,
+            0.0,
+            False,
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
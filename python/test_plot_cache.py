@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the on-disk plot cache used by the ``plot`` CLI mode.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+
+sys.path.insert(0, str(Path(__file__).parent))
+import get_data_info
+from get_data_info import run_cli
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "plot-cache"
+    monkeypatch.setattr(get_data_info, "PLOT_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    file_path = tmp_path / "small.nc"
+    xr.Dataset(
+        {"temperature": (("lat", "lon"), np.arange(12.0).reshape(3, 4))},
+        coords={"lat": [0.0, 1.0, 2.0], "lon": [0.0, 1.0, 2.0, 3.0]},
+    ).to_netcdf(file_path)
+    return file_path
+
+
+def _fail_create_plot(*_args, **_kwargs):
+    raise AssertionError("create_plot should not run on a cache hit")
+
+
+class TestPlotCache:
+    """Test plot output reuse across run_cli calls."""
+
+    def test_second_call_is_served_from_cache(
+        self, cache_dir, sample_file, monkeypatch
+    ):
+        output, exit_code = run_cli(["plot", str(sample_file), "temperature"])
+        assert exit_code == 0
+        assert "result" in json.loads(output)
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        monkeypatch.setattr(get_data_info, "create_plot", _fail_create_plot)
+        cached_output, exit_code = run_cli(["plot", str(sample_file), "temperature"])
+        assert exit_code == 0
+        assert cached_output == output
+
+    def test_modified_file_is_a_cache_miss(self, cache_dir, sample_file):
+        run_cli(["plot", str(sample_file), "temperature"])
+        stat = sample_file.stat()
+        os.utime(sample_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        run_cli(["plot", str(sample_file), "temperature"])
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+    def test_chunk_rewritten_in_nested_zarr_store_is_a_cache_miss(
+        self, cache_dir, tmp_path
+    ):
+        zarr = pytest.importorskip("zarr")
+        store = tmp_path / "nested.zarr"
+        xr.DataTree.from_dict(
+            {"/group": xr.Dataset({"t": (("y", "x"), np.zeros((3, 4)))})}
+        ).to_zarr(store)
+        # Age the whole store so that the in-place rewrite below gets a newer mtime
+        for path in [store, *store.rglob("*")]:
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**10))
+
+        run_cli(["plot", str(store), "/group/t"])
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        # Only the chunk files under group/t change, not the top-level metadata
+        zarr.open_array(store / "group" / "t", mode="r+")[:] = 7
+        run_cli(["plot", str(store), "/group/t"])
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+    def test_new_renderer_version_is_a_cache_miss(
+        self, cache_dir, sample_file, monkeypatch
+    ):
+        run_cli(["plot", str(sample_file), "temperature"])
+        versions = {**get_data_info._plot_renderer_versions(), "extension": "99.0.0"}
+        monkeypatch.setattr(get_data_info, "_plot_renderer_versions", lambda: versions)
+        run_cli(["plot", str(sample_file), "temperature"])
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+    def test_new_cache_format_is_a_cache_miss(
+        self, cache_dir, sample_file, monkeypatch
+    ):
+        run_cli(["plot", str(sample_file), "temperature"])
+        monkeypatch.setattr(
+            get_data_info, "PLOT_CACHE_FORMAT", get_data_info.PLOT_CACHE_FORMAT + 1
+        )
+        run_cli(["plot", str(sample_file), "temperature"])
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+    def test_different_arguments_are_a_cache_miss(self, cache_dir, sample_file):
+        run_cli(["plot", str(sample_file), "temperature"])
+        run_cli(["plot", str(sample_file), "temperature", "--cmap", "magma"])
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+    def test_no_plot_cache_flag(self, cache_dir, sample_file):
+        run_cli(["plot", str(sample_file), "temperature", "--no-plot-cache"])
+        assert not cache_dir.exists()
+
+    def test_errors_are_not_cached(self, cache_dir, sample_file):
+        output, _ = run_cli(["plot", str(sample_file), "not_a_variable"])
+        assert "error" in json.loads(output)
+        assert not list(cache_dir.glob("*.json"))
+
+    def test_eviction_keeps_cache_under_limit(
+        self, cache_dir, sample_file, monkeypatch
+    ):
+        monkeypatch.setattr(get_data_info, "PLOT_CACHE_MAX_BYTES", 1)
+        run_cli(["plot", str(sample_file), "temperature"])
+        run_cli(["plot", str(sample_file), "temperature", "--cmap", "magma"])
+        assert not list(cache_dir.glob("*.json"))
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+class TestPlotCacheDirectory:
+    """Test that the plot cache directory is private to the current user."""
+
+    def test_created_private_to_the_user(self, cache_dir, sample_file):
+        run_cli(["plot", str(sample_file), "temperature"])
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+    def test_directory_accessible_to_others_is_not_used(self, cache_dir, sample_file):
+        cache_dir.mkdir(mode=0o755)
+        cache_dir.chmod(0o755)
+        run_cli(["plot", str(sample_file), "temperature"])
+        assert not list(cache_dir.glob("*.json"))
+
+    def test_planted_entries_are_not_replayed(self, cache_dir, sample_file):
+        run_cli(["plot", str(sample_file), "temperature"])
+        (cache_file,) = cache_dir.glob("*.json")
+        cache_file.write_text(json.dumps({"result": "planted"}), encoding="utf-8")
+        cache_dir.chmod(0o777)
+        output, _ = run_cli(["plot", str(sample_file), "temperature"])
+        assert "planted" not in output
+
+    def test_symlink_is_not_used(self, cache_dir, sample_file, tmp_path):
+        target = tmp_path / "elsewhere"
+        target.mkdir(mode=0o700)
+        cache_dir.symlink_to(target)
+        run_cli(["plot", str(sample_file), "temperature"])
+        assert not list(target.glob("*.json"))
+
+    @pytest.mark.skipif(
+        not hasattr(os, "getuid") or os.getuid() != 0,
+        reason="changing the owner requires root",
+    )
+    def test_directory_of_another_user_is_not_used(self, cache_dir, sample_file):
+        cache_dir.mkdir(mode=0o700)
+        os.chown(cache_dir, os.getuid() + 1, -1)
+        run_cli(["plot", str(sample_file), "temperature"])
+        assert not list(cache_dir.glob("*.json"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
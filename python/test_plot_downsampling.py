@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Unit tests for thinning oversized image dimensions before plotting.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+
+sys.path.insert(0, str(Path(__file__).parent))
+from get_data_info import _thin_image_dims
+
+
+class TestThinImageDims:
+    """Test _thin_image_dims."""
+
+    def test_small_variable_is_returned_unchanged(self):
+        var = xr.DataArray(np.zeros((3, 10, 20)), dims=("time", "lat", "lon"))
+        assert _thin_image_dims(var, max_pixels=20) is var
+
+    def test_only_oversized_image_dims_are_thinned(self):
+        var = xr.DataArray(np.zeros((50, 10, 45)), dims=("time", "lat", "lon"))
+        thinned = _thin_image_dims(var, max_pixels=20)
+        assert thinned.sizes == {"time": 50, "lat": 10, "lon": 15}
+
+    def test_thinned_size_never_exceeds_max_pixels(self):
+        var = xr.DataArray(np.zeros((41, 2400)), dims=("y", "x"))
+        thinned = _thin_image_dims(var, max_pixels=20)
+        assert thinned.sizes["y"] <= 20
+        assert thinned.sizes["x"] <= 20
+
+    def test_keeps_coordinates_of_kept_cells(self):
+        var = xr.DataArray(
+            np.arange(30.0).reshape(1, 30),
+            dims=("y", "x"),
+            coords={"x": np.arange(30) * 10},
+        )
+        thinned = _thin_image_dims(var, max_pixels=10)
+        np.testing.assert_array_equal(thinned["x"].values, np.arange(0, 300, 30))
+        np.testing.assert_array_equal(thinned.values[0], np.arange(0.0, 30.0, 3.0))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the long-lived worker process (worker.py): request dispatch and
+the newline-delimited JSON protocol spoken with the extension.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import matplotlib as mpl
+import numpy as np
+import pytest
+import xarray as xr
+
+sys.path.insert(0, str(Path(__file__).parent))
+from worker import handle_request
+
+
+class TestHandleRequest:
+    """Test handle_request dispatch (no subprocess)."""
+
+    def test_check_packages(self):
+        output, exit_code = handle_request(
+            {"op": "check_packages", "args": ["json", "surely_not_a_package"]}
+        )
+        assert exit_code == 0
+        assert json.loads(output) == {"json": True, "surely_not_a_package": False}
+
+    def test_unknown_op(self):
+        output, exit_code = handle_request({"op": "nope", "args": []})
+        assert exit_code == 1
+        assert "Unknown worker op" in json.loads(output)["error"]
+
+    def test_invalid_arguments_do_not_exit(self):
+        # argparse raises SystemExit on missing arguments; the worker must survive it
+        output, exit_code = handle_request({"op": "plot", "args": []})
+        assert exit_code == 1
+        assert "error" in json.loads(output)
+
+    def test_plot_missing_file_returns_error_payload(self):
+        output, exit_code = handle_request(
+            {"op": "plot", "args": ["/nonexistent/file.nc", "var"]}
+        )
+        assert exit_code == 0
+        assert "error" in json.loads(output)
+
+    def test_plot_style_does_not_leak_into_next_request(self, tmp_path):
+        # Each plot must start from the default rcParams, whatever style the
+        # previous request of the same worker applied. The styled rcParams stay
+        # in place after a request, so they are those the plot was drawn with.
+        file_path = tmp_path / "small.nc"
+        xr.Dataset(
+            {"temperature": (("lat", "lon"), np.arange(12.0).reshape(3, 4))},
+            coords={"lat": [0.0, 1.0, 2.0], "lon": [0.0, 1.0, 2.0, 3.0]},
+        ).to_netcdf(file_path)
+
+        def plot(style):
+            _, exit_code = handle_request(
+                {
+                    "op": "plot",
+                    "args": [
+                        str(file_path),
+                        "temperature",
+                        "--style",
+                        style,
+                        "--no-plot-cache",
+                    ],
+                }
+            )
+            assert exit_code == 0
+            return dict(mpl.rcParams)
+
+        plot("default")
+        after_default = plot("seaborn-v0_8-poster")
+        plot("dark_background")
+        after_dark = plot("seaborn-v0_8-poster")
+        assert after_dark == after_default
+        assert after_dark["axes.facecolor"] == "white"
+
+
+class TestWorkerProtocol:
+    """Test the stdin/stdout protocol of the worker script."""
+
+    def test_one_response_line_per_request(self):
+        script = Path(__file__).parent / "worker.py"
+        requests = [
+            {"id": 1, "op": "check_packages", "args": ["json"]},
+            {"id": 2, "op": "nope", "args": []},
+        ]
+        result = subprocess.run(
+            [sys.executable, str(script)],
+            input="".join(json.dumps(r) + "\n" for r in requests) + "not json\n",
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert result.returncode == 0
+        responses = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [r["id"] for r in responses] == [1, 2, None]
+        assert responses[0] == {"id": 1, "exit_code": 0, "output": {"json": True}}
+        assert responses[1]["exit_code"] == 1
+        assert responses[2]["exit_code"] == 1
+
+    def test_non_object_requests_do_not_stop_the_worker(self):
+        script = Path(__file__).parent / "worker.py"
+        lines = ["[]", '"x"', '{"id": 3, "op": "check_packages", "args": 5}']
+        lines.append(json.dumps({"id": 4, "op": "check_packages", "args": ["json"]}))
+        result = subprocess.run(
+            [sys.executable, str(script)],
+            input="".join(line + "\n" for line in lines),
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert result.returncode == 0
+        responses = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [r["id"] for r in responses] == [None, None, 3, 4]
+        assert [r["exit_code"] for r in responses] == [1, 1, 1, 0]
+        assert "JSON object" in responses[0]["output"]["error"]
+        assert responses[3]["output"] == {"json": True}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
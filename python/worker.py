@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Long-lived worker process for the Scientific Data Viewer extension.
+
+Spawning one interpreter per request pays Python startup plus the numpy /
+xarray / matplotlib imports every time, which dominates the cost of a plot.
+This script is spawned once by the extension and answers requests read from
+stdin, one JSON object per line:
+
+    {"id": 1, "op": "check_packages", "args": ["xarray", "zarr"]}
+    {"id": 2, "op": "info", "args": ["sample_data.nc", "--small-variable-bytes", "1000"]}
+    {"id": 3, "op": "plot", "args": ["sample_data.nc", "temperature", "auto"]}
+
+``args`` is the same argument vector the standalone scripts accept on the command
+line. Each request gets exactly one response line on stdout:
+
+    {"id": 1, "exit_code": 0, "output": {...}}
+
+where ``output`` is the JSON the standalone script would have printed. Logs go to
+stderr, and anything a library prints while handling a request is redirected to
+stderr so stdout only carries responses.
+"""
+
+import contextlib
+import json
+import sys
+import traceback
+from collections.abc import Callable
+from importlib.util import find_spec
+
+# Capture the real stdout before anything can redirect it: responses go here only.
+_RESPONSE_STREAM = sys.stdout
+
+if hasattr(sys.stderr, "reconfigure"):
+    sys.stderr.reconfigure(line_buffering=True)
+
+# Pay the heavy imports once, at startup, instead of once per request.
+import check_package_availability  # noqa: E402
+
+# The package check must keep working when xarray itself is missing (that is
+# precisely what it is asked to detect), so get_data_info is optional here.
+try:
+    import get_data_info
+except ImportError as e:
+    get_data_info = None
+    _GET_DATA_INFO_IMPORT_ERROR = f"{type(e).__name__}: {e}"
+
+
+def _warm_up_matplotlib() -> None:
+    """Select the Agg backend and render a throwaway figure once.
+
+    Importing pyplot builds the font manager, but font lookup, FreeType face
+    loading and the mathtext parser (used by the scientific-notation tick
+    formatter) are only initialized on the first draw. Paying for them here
+    keeps that cost out of the first plot request.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure(figsize=(1, 1))
+    fig.text(0.5, 0.5, r"warm-up $10^{3}$")
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+if find_spec("matplotlib") is not None:
+    _warm_up_matplotlib()
+
+
+def _check_packages(args: list[str]) -> tuple[str, int]:
+    return json.dumps(check_package_availability.check_package_availability(args)), 0
+
+
+def _run_get_data_info(mode: str) -> Callable[[list[str]], tuple[str, int]]:
+    def handler(args: list[str]) -> tuple[str, int]:
+        if get_data_info is None:
+            return json.dumps({"error": _GET_DATA_INFO_IMPORT_ERROR}), 1
+        return get_data_info.run_cli([mode, *args])
+
+    return handler
+
+
+HANDLERS: dict[str, Callable[[list[str]], tuple[str, int]]] = {
+    "check_packages": _check_packages,
+    "info": _run_get_data_info("info"),
+    "plot": _run_get_data_info("plot"),
+}
+
+
+def handle_request(request: dict) -> tuple[str, int]:
+    """Dispatch a single request and return (json_output, exit_code)."""
+    op = request.get("op")
+    handler = HANDLERS.get(op)
+    if handler is None:
+        return json.dumps({"error": f"Unknown worker op: {op!r}"}), 1
+    args = [str(a) for a in request.get("args", [])]
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            return handler(args)
+    except SystemExit as e:
+        # argparse exits on invalid arguments; keep the worker alive
+        message = f"Invalid arguments for {op!r} (exit status {e.code}, see stderr)"
+        return json.dumps({"error": message}), 1
+    except Exception as e:
+        traceback.print_exc(file=sys.stderr)
+        return json.dumps({"error": f"{type(e).__name__}: {e}"}), 1
+
+
+def main() -> int:
+    """Serve requests from stdin until it is closed."""
+    check_package_availability._log(
+        "INFO", "Worker ready, waiting for requests on stdin"
+    )
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise TypeError(f"Expected a JSON object, got {type(request).__name__}")
+            request_id = request.get("id")
+            output, exit_code = handle_request(request)
+        except (json.JSONDecodeError, TypeError) as e:
+            output, exit_code = json.dumps({"error": f"Invalid request JSON: {e}"}), 1
+        except Exception as e:
+            # handle_request already turns handler failures into error payloads;
+            # whatever still gets here must not end the worker for every client
+            traceback.print_exc(file=sys.stderr)
+            output, exit_code = json.dumps({"error": f"{type(e).__name__}: {e}"}), 1
+        # ``output`` is already JSON: splice it in rather than re-encoding
+        # a potentially multi-megabyte base64 payload.
+        _RESPONSE_STREAM.write(
+            f'{{"id": {json.dumps(request_id)}, "exit_code": {exit_code}, "output": {output}}}\n'
+        )
+        _RESPONSE_STREAM.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -275,6 +275,7 @@ export function deactivate() {
                 `🧩 🧹 Aborted ${abortedCount} active Python process(es) during deactivation`,
             );
         }
+        dataProcessor.pythonManagerInstance.disposeWorker();
     }
 
     // Dispose of data viewer panel static resources
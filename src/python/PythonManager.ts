@@ -1,6 +1,11 @@
 import { spawn, ChildProcess } from 'child_process';
 import { Logger } from '../common/Logger';
 import { ExtensionVirtualEnvironmentManager } from './ExtensionVirtualEnvironmentManager';
+import {
+    PythonWorkerPool,
+    PythonWorkerTask,
+    forwardPythonLogs,
+} from './PythonWorker';
 import { quoteIfNeeded } from '../common/utils';
 import { showErrorMessage } from '../common/vscodeutils';
 import { getPythonInterpreterFromPythonExtension } from './officialPythonExtensionApiUtils';
@@ -15,7 +20,8 @@ import path from 'path';
  * Represents an active Python process that can be tracked and aborted
  */
 interface ActiveProcess {
-    process: ChildProcess;
+    process?: ChildProcess; // Unset while a worker request is still queued
+    abort?: () => boolean; // Aborts a worker request without killing other requests
     operationId: string;
     startTime: number;
     timeoutHandle?: NodeJS.Timeout; // Server-side timeout handle
@@ -29,6 +35,30 @@ interface ActiveProcess {
  */
 const ATTEMPT_CREATING_EXTENSION_OWN_UV_ENVIRONMENT = true;
 
+/**
+ * Number of long-lived Python workers, i.e. of worker requests running in parallel
+ */
+const WORKER_POOL_SIZE = 3;
+
+/**
+ * Scripts served by the long-lived Python worker (python/worker.py) instead of
+ * a dedicated process per call. Maps script file name to a function returning
+ * the worker op and its arguments, or null when the call must be spawned.
+ */
+const WORKER_SCRIPT_OPS: Record<
+    string,
+    (args: string[]) => { op: string; args: string[] } | null
+> = {
+    'check_package_availability.py': (args) => ({
+        op: 'check_packages',
+        args,
+    }),
+    'get_data_info.py': (args) =>
+        args[0] === 'info' || args[0] === 'plot'
+            ? { op: args[0], args: args.slice(1) }
+            : null,
+};
+
 /**
  * Enum to represent the source of the Python environment
  * - override: The user has set an override Python interpreter when set
@@ -62,6 +92,9 @@ export class PythonManager {
     // Track active processes for timeout/abort handling
     private _activeProcesses: Map<string, ActiveProcess> = new Map();
 
+    // Long-lived Python workers, (re)spawned on demand for the current interpreter
+    private _workerPool: PythonWorkerPool | null = null;
+
     // Core packages required for basic functionality
     private readonly corePackages = ['xarray'];
     private readonly plotPackages = ['matplotlib'];
@@ -118,6 +151,7 @@ export class PythonManager {
     async forceInitialize(): Promise<void> {
         Logger.info('🐍 🔄 Force initializing Python environment...');
         this._initializationPromise = null; // Reset any existing initialization
+        this.disposeWorker(); // The environment may have changed under the worker
         await this.initializeIfNotInitializing();
     }
 
@@ -192,6 +226,19 @@ export class PythonManager {
         ].join(' ');
         Logger.log(`🐍 📜 Full command (copy-paste): ${fullCommand}`);
 
+        const workerRequest =
+            WORKER_SCRIPT_OPS[path.basename(scriptPath)]?.(args) ?? null;
+        if (workerRequest !== null) {
+            return await this.executeWorkerRequest(
+                pythonPath,
+                workerRequest.op,
+                workerRequest.args,
+                enableLogs,
+                operationId,
+                timeoutMs,
+            );
+        }
+
         return new Promise((resolve, reject) => {
             // Spawn Python directly (shell: false) so we have one child process. That way:
             // - stdout/stderr are always captured (including on Windows; detached breaks pipes there).
@@ -249,42 +296,7 @@ export class PythonManager {
 
                 if (enableLogs) {
                     // Forward Python logs to VSCode Logger
-                    // Parse log lines and forward them
-                    const lines = logData
-                        .split('\n')
-                        .filter((line: string) => line.trim());
-                    lines.forEach((line: string) => {
-                        if (line.includes(' - INFO - ')) {
-                            const message = line.split(' - INFO - ')[1];
-                            if (message) {
-                                Logger.info(`🐍 📜 [Python] [INFO] ${message}`);
-                            }
-                        } else if (line.includes(' - ERROR - ')) {
-                            const message = line.split(' - ERROR - ')[1];
-                            if (message) {
-                                Logger.error(
-                                    `🐍 📜 [Python] [ERROR] ${message}`,
-                                );
-                            }
-                        } else if (line.includes(' - WARNING - ')) {
-                            const message = line.split(' - WARNING - ')[1];
-                            if (message) {
-                                Logger.warn(
-                                    `🐍 📜 [Python] [WARNING] ${message}`,
-                                );
-                            }
-                        } else if (line.includes(' - DEBUG - ')) {
-                            const message = line.split(' - DEBUG - ')[1];
-                            if (message) {
-                                Logger.debug(
-                                    `🐍 📜 [Python] [DEBUG] ${message}`,
-                                );
-                            }
-                        } else if (line.trim()) {
-                            // Any other stderr output that doesn't match the log format
-                            Logger.info(`🐍 📜 [Python] ${line.trim()}`);
-                        }
-                    });
+                    forwardPythonLogs(logData);
                 }
             });
 
@@ -433,6 +445,125 @@ export class PythonManager {
         });
     }
 
+    /**
+     * Get the Python worker pool for the given interpreter, replacing the current
+     * one if it was started with a different interpreter
+     * @param pythonPath    The path to the Python interpreter
+     */
+    private getWorkerPool(pythonPath: string): PythonWorkerPool {
+        if (
+            this._workerPool === null ||
+            this._workerPool.pythonPath !== pythonPath
+        ) {
+            this.disposeWorker();
+            this._workerPool = new PythonWorkerPool(
+                pythonPath,
+                path.join(__dirname, '../../../python/worker.py'),
+                WORKER_POOL_SIZE,
+            );
+        }
+        return this._workerPool;
+    }
+
+    /**
+     * Stop the long-lived Python workers. The next request spawns fresh ones,
+     * e.g. to pick up newly installed packages.
+     */
+    public disposeWorker(): void {
+        if (this._workerPool !== null) {
+            this._workerPool.dispose();
+            this._workerPool = null;
+        }
+    }
+
+    /**
+     * Execute a request on the long-lived Python workers.
+     * @param pythonPath    The path to the Python interpreter
+     * @param op            The worker operation (see python/worker.py)
+     * @param args          The command line arguments of the corresponding script
+     * @param enableLogs    Whether to hand the worker logs over to the VSCode Logger
+     * @param operationId   Optional ID to track this operation for abort support
+     * @param timeoutMs     Optional server-side timeout in milliseconds, counted
+     *                      from the moment a worker starts running the request
+     * @returns             The JSON output the script would have printed
+     */
+    private async executeWorkerRequest(
+        pythonPath: string,
+        op: string,
+        args: string[],
+        enableLogs: boolean,
+        operationId?: string,
+        timeoutMs?: number,
+    ): Promise<any> {
+        let task: PythonWorkerTask | null = null;
+
+        // Aborting fails this request only: it leaves the queue, or the worker
+        // running it is killed. Requests on the other workers keep running.
+        if (operationId) {
+            this._activeProcesses.set(operationId, {
+                operationId,
+                startTime: Date.now(),
+                abort: () => task?.abort() ?? false,
+            });
+        }
+
+        task = this.getWorkerPool(pythonPath).request(op, args, {
+            enableLogs,
+            onStart: (workerProcess) => {
+                const activeProcess = operationId
+                    ? this._activeProcesses.get(operationId)
+                    : undefined;
+                if (!activeProcess) {
+                    return;
+                }
+                activeProcess.process = workerProcess;
+                activeProcess.startTime = Date.now();
+                if (timeoutMs && timeoutMs > 0) {
+                    activeProcess.timeoutHandle = setTimeout(() => {
+                        Logger.warn(
+                            `🐍 ⏰ Server-side timeout (${timeoutMs}ms) reached for operation: ${operationId}`,
+                        );
+                        this.abortProcess(activeProcess.operationId);
+                    }, timeoutMs);
+                }
+                Logger.debug(
+                    `🐍 📜 Tracking worker request for operation: ${operationId} (PID: ${workerProcess.pid})`,
+                );
+            },
+        });
+
+        try {
+            const response = await task.response;
+            if (response.exit_code === 0) {
+                return response.output;
+            }
+            Logger.error(
+                `🐍 👷 Python worker request '${op}' failed with code ${response.exit_code}: ${JSON.stringify(response.output)?.slice(0, 1000)}`,
+            );
+            if (response.stderr) {
+                Logger.error(
+                    `🐍 👷 Python worker stderr: ${response.stderr.slice(-1000)}`,
+                );
+            }
+            const output = response.output;
+            throw new Error(
+                output &&
+                typeof output.error === 'string' &&
+                output.error.length > 0
+                    ? output.error
+                    : `Python script failed (exit code ${response.exit_code})`,
+            );
+        } finally {
+            if (operationId) {
+                const activeProcess = this._activeProcesses.get(operationId);
+                if (activeProcess?.timeoutHandle) {
+                    clearTimeout(activeProcess.timeoutHandle);
+                }
+                this._activeProcesses.delete(operationId);
+            }
+        }
+    }
+
     /**
      * Abort an active Python process by operation ID
      * @param operationId The ID of the operation to abort
@@ -452,15 +583,20 @@ export class PythonManager {
             clearTimeout(activeProcess.timeoutHandle);
         }
 
-        const { process: childProcess } = activeProcess;
+        const { process: childProcess, abort } = activeProcess;
         const duration = Date.now() - activeProcess.startTime;
-        const pid = childProcess.pid;
+        const pid = childProcess?.pid;
 
         Logger.info(
             `🐍 🛑 Aborting process for operation: ${operationId} (PID: ${pid}, duration: ${duration}ms)`,
         );
 
-        if (pid === undefined) {
+        if (abort) {
+            this._activeProcesses.delete(operationId);
+            return abort();
+        }
+
+        if (childProcess === undefined || pid === undefined) {
             Logger.warn(
                 `🐍 ⚠️ Process PID is undefined, cannot kill: ${operationId}`,
             );
@@ -973,6 +1109,8 @@ export class PythonManager {
                             ', ',
                         )}`,
                     );
+                    // The worker has already imported (or failed to import) the old packages
+                    this.disposeWorker();
                     resolve();
                 } else {
                     // Create detailed error message with pip output
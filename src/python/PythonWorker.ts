@@ -0,0 +1,430 @@
+import { spawn, ChildProcess } from 'child_process';
+import { Logger } from '../common/Logger';
+
+/**
+ * Response line written by python/worker.py for each request
+ */
+export interface PythonWorkerResponse {
+    id: number;
+    exit_code: number;
+    output: any;
+    /** Worker stderr during the request, when its logs were not forwarded */
+    stderr?: string;
+}
+
+/**
+ * Options of a request sent to a PythonWorkerPool
+ */
+export interface PythonWorkerRequestOptions {
+    /** Forward the worker logs of this request to the VSCode Logger */
+    enableLogs?: boolean;
+    /** Called when the request is written to a worker, i.e. when it starts running */
+    onStart?: (workerProcess: ChildProcess) => void;
+}
+
+/**
+ * Handle on a request sent to a PythonWorkerPool
+ */
+export interface PythonWorkerTask {
+    /** The worker response for this request */
+    readonly response: Promise<PythonWorkerResponse>;
+    /**
+     * Fail this request only: drop it if it is still queued, or kill the worker
+     * running it. Other requests are not affected.
+     * @returns true if the request was still queued or running
+     */
+    abort(): boolean;
+}
+
+interface InFlightRequest {
+    id: number;
+    process: ChildProcess;
+    enableLogs: boolean;
+    stderr: string[];
+    resolve: (response: PythonWorkerResponse) => void;
+    reject: (error: Error) => void;
+}
+
+interface QueuedRequest {
+    op: string;
+    args: string[];
+    options: PythonWorkerRequestOptions;
+    worker: PythonWorker | null;
+    resolve: (response: PythonWorkerResponse) => void;
+    reject: (error: Error) => void;
+}
+
+/**
+ * Forward Python stderr output (logging format " - LEVEL - message") to the VSCode Logger
+ * @param logData   Raw stderr chunk
+ */
+export function forwardPythonLogs(logData: string): void {
+    const lines = logData.split('\n').filter((line: string) => line.trim());
+    lines.forEach((line: string) => {
+        if (line.includes(' - INFO - ')) {
+            const message = line.split(' - INFO - ')[1];
+            if (message) {
+                Logger.info(`🐍 📜 [Python] [INFO] ${message}`);
+            }
+        } else if (line.includes(' - ERROR - ')) {
+            const message = line.split(' - ERROR - ')[1];
+            if (message) {
+                Logger.error(`🐍 📜 [Python] [ERROR] ${message}`);
+            }
+        } else if (line.includes(' - WARNING - ')) {
+            const message = line.split(' - WARNING - ')[1];
+            if (message) {
+                Logger.warn(`🐍 📜 [Python] [WARNING] ${message}`);
+            }
+        } else if (line.includes(' - DEBUG - ')) {
+            const message = line.split(' - DEBUG - ')[1];
+            if (message) {
+                Logger.debug(`🐍 📜 [Python] [DEBUG] ${message}`);
+            }
+        } else if (line.trim()) {
+            // Any other stderr output that doesn't match the log format
+            Logger.info(`🐍 📜 [Python] ${line.trim()}`);
+        }
+    });
+}
+
+/**
+ * Long-lived Python process (python/worker.py) answering JSON requests over stdio.
+ *
+ * Spawning one interpreter per call pays Python startup and the xarray/matplotlib
+ * imports every time; the worker pays them once. Requests are newline-delimited
+ * JSON objects on stdin, responses are newline-delimited JSON objects on stdout,
+ * matched by id. The worker runs one request at a time: see PythonWorkerPool for
+ * concurrent requests.
+ *
+ * Killing the worker fails its running request only (like a per-call process);
+ * the next request spawns a fresh process.
+ */
+export class PythonWorker {
+    private _process: ChildProcess | null = null;
+    private _nextId: number = 1;
+    private _current: InFlightRequest | null = null;
+
+    constructor(
+        readonly pythonPath: string,
+        private readonly scriptPath: string,
+    ) {}
+
+    /**
+     * The worker child process, spawning it if needed
+     */
+    get process(): ChildProcess {
+        if (this._process === null) {
+            this._process = this.spawnWorker();
+        }
+        return this._process;
+    }
+
+    /**
+     * Whether a request is running, or a killed process has not exited yet
+     */
+    get busy(): boolean {
+        return this._current !== null;
+    }
+
+    /**
+     * Send a request to the worker, which must not be busy
+     * @param op            Operation name (see HANDLERS in python/worker.py)
+     * @param args          Command line arguments of the corresponding script
+     * @param enableLogs    Forward the worker logs of this request to the VSCode Logger
+     * @returns             The worker response for this request
+     */
+    request(
+        op: string,
+        args: string[],
+        enableLogs: boolean = true,
+    ): Promise<PythonWorkerResponse> {
+        if (this._current !== null) {
+            return Promise.reject(
+                new Error('Python worker is already running a request'),
+            );
+        }
+        const childProcess = this.process;
+        const id = this._nextId++;
+        return new Promise((resolve, reject) => {
+            this._current = {
+                id,
+                process: childProcess,
+                enableLogs,
+                stderr: [],
+                resolve,
+                reject,
+            };
+            childProcess.stdin?.write(JSON.stringify({ id, op, args }) + '\n');
+        });
+    }
+
+    /**
+     * Kill the worker process, failing its running request. The request is
+     * rejected, and the worker becomes available again, once the process exited.
+     */
+    kill(): void {
+        const childProcess = this._process;
+        if (childProcess === null) {
+            return;
+        }
+        this._process = null;
+        Logger.debug(
+            `🐍 👷 Killing Python worker with SIGTERM (PID: ${childProcess.pid})`,
+        );
+        childProcess.kill('SIGTERM');
+        // If the process doesn't terminate within 1 second, force kill
+        setTimeout(() => {
+            if (childProcess.exitCode === null && childProcess.signalCode === null) {
+                childProcess.kill('SIGKILL');
+                Logger.debug(
+                    `🐍 👷 Force killed Python worker (PID: ${childProcess.pid})`,
+                );
+            }
+        }, 1000);
+    }
+
+    /**
+     * Stop the worker. A running request is rejected.
+     */
+    dispose(): void {
+        if (this._process !== null) {
+            Logger.debug(
+                `🐍 👷 Stopping Python worker (PID: ${this._process.pid})`,
+            );
+            this._process.stdin?.end();
+            this._process.kill('SIGTERM');
+            this._process = null;
+        }
+    }
+
+    private spawnWorker(): ChildProcess {
+        Logger.info(
+            `🐍 👷 Starting Python worker ${this.scriptPath} with ${this.pythonPath}`,
+        );
+        // Spawn Python directly (shell: false) so that killing the child kills the worker
+        const childProcess = spawn(this.pythonPath, [this.scriptPath], {
+            shell: false,
+            stdio: ['pipe', 'pipe', 'pipe'],
+            env: {
+                ...process.env,
+                PYTHONUNBUFFERED: '1',
+            },
+        });
+        Logger.debug(`🐍 👷 Python worker started (PID: ${childProcess.pid})`);
+
+        // Responses may be split across chunks (base64 plots are large): only join
+        // the buffered chunks once a full line has arrived. The buffer belongs to
+        // this process, so output of a killed process never mixes with its successor.
+        let stdoutChunks: string[] = [];
+        childProcess.stdout.setEncoding('utf8');
+        childProcess.stdout.on('data', (data: string) => {
+            let chunk = data;
+            let newline = chunk.indexOf('\n');
+            while (newline !== -1) {
+                stdoutChunks.push(chunk.slice(0, newline));
+                const line = stdoutChunks.join('');
+                stdoutChunks = [];
+                this.onResponseLine(childProcess, line);
+                chunk = chunk.slice(newline + 1);
+                newline = chunk.indexOf('\n');
+            }
+            if (chunk.length > 0) {
+                stdoutChunks.push(chunk);
+            }
+        });
+
+        childProcess.stderr.on('data', (data) => {
+            const current = this.currentRequestOf(childProcess);
+            // Startup and crash output is always forwarded; request logs only
+            // when the request asked for it, and otherwise kept for its response
+            if (current === null || current.enableLogs) {
+                forwardPythonLogs(data.toString());
+            } else {
+                current.stderr.push(data.toString());
+            }
+        });
+
+        // Writing to a worker that just died must not become an uncaught error;
+        // the 'close' handler below rejects the running request.
+        childProcess.stdin.on('error', (error) => {
+            Logger.debug(`🐍 👷 Python worker stdin error: ${error.message}`);
+        });
+
+        childProcess.on('close', (code, signal) => {
+            Logger.debug(
+                `🐍 👷 Python worker exited (PID: ${childProcess.pid}, code: ${code}, signal: ${signal})`,
+            );
+            if (this._process === childProcess) {
+                this._process = null;
+            }
+            this.failCurrentRequestOf(
+                childProcess,
+                signal === 'SIGTERM' || signal === 'SIGKILL'
+                    ? new Error(
+                          `Process was aborted (signal: ${signal}). This usually happens when a plot operation times out, or if the plot operation was cancelled by the user.`,
+                      )
+                    : new Error(`Python worker exited with code ${code}`),
+            );
+        });
+
+        childProcess.on('error', (error) => {
+            if (this._process === childProcess) {
+                this._process = null;
+            }
+            this.failCurrentRequestOf(
+                childProcess,
+                error.message.includes('ENOENT')
+                    ? new Error(
+                          `Python interpreter not found at: ${this.pythonPath}. Please check your Python installation.`,
+                      )
+                    : new Error(
+                          `Failed to execute Python worker: ${error.message}`,
+                      ),
+            );
+        });
+
+        return childProcess;
+    }
+
+    private currentRequestOf(childProcess: ChildProcess): InFlightRequest | null {
+        return this._current?.process === childProcess ? this._current : null;
+    }
+
+    private failCurrentRequestOf(childProcess: ChildProcess, error: Error): void {
+        const current = this.currentRequestOf(childProcess);
+        if (current !== null) {
+            this._current = null;
+            current.reject(error);
+        }
+    }
+
+    private onResponseLine(childProcess: ChildProcess, line: string): void {
+        if (!line.trim()) {
+            return;
+        }
+        let response: PythonWorkerResponse;
+        try {
+            response = JSON.parse(line);
+        } catch (error) {
+            Logger.error(
+                `🐍 👷 Unparsable Python worker response (length=${line.length}): ${line.slice(0, 300)}`,
+            );
+            return;
+        }
+        const current = this.currentRequestOf(childProcess);
+        if (current === null || current.id !== response.id) {
+            Logger.warn(
+                `🐍 👷 Python worker response for unknown request id: ${response.id}`,
+            );
+            return;
+        }
+        this._current = null;
+        if (current.stderr.length > 0) {
+            response.stderr = current.stderr.join('');
+        }
+        current.resolve(response);
+    }
+}
+
+/**
+ * Small pool of PythonWorker processes for one interpreter.
+ *
+ * Each worker runs one request at a time, so independent requests (e.g. data info
+ * of one panel and a plot of another) run in parallel, up to the pool size; the
+ * others wait in a queue. Workers are spawned on demand and kept alive.
+ */
+export class PythonWorkerPool {
+    private readonly _workers: PythonWorker[] = [];
+    private _queue: QueuedRequest[] = [];
+
+    constructor(
+        readonly pythonPath: string,
+        private readonly scriptPath: string,
+        private readonly size: number,
+    ) {}
+
+    /**
+     * Queue a request, sent to the first available worker
+     * @param op        Operation name (see HANDLERS in python/worker.py)
+     * @param args      Command line arguments of the corresponding script
+     * @param options   Log forwarding and start notification
+     * @returns         Handle to await or abort the request
+     */
+    request(
+        op: string,
+        args: string[],
+        options: PythonWorkerRequestOptions = {},
+    ): PythonWorkerTask {
+        let queued!: QueuedRequest;
+        const response = new Promise<PythonWorkerResponse>((resolve, reject) => {
+            queued = { op, args, options, worker: null, resolve, reject };
+        });
+        this._queue.push(queued);
+        this.dispatch();
+        return { response, abort: () => this.abort(queued) };
+    }
+
+    /**
+     * Stop all workers. Running and queued requests are rejected.
+     */
+    dispose(): void {
+        const queue = this._queue;
+        this._queue = [];
+        queue.forEach(({ reject }) =>
+            reject(new Error('Python worker pool was stopped')),
+        );
+        this._workers.forEach((worker) => worker.dispose());
+        this._workers.length = 0;
+    }
+
+    private dispatch(): void {
+        while (this._queue.length > 0) {
+            const worker = this.availableWorker();
+            if (worker === null) {
+                return;
+            }
+            const queued = this._queue.shift()!;
+            queued.worker = worker;
+            queued.options.onStart?.(worker.process);
+            worker
+                .request(queued.op, queued.args, queued.options.enableLogs ?? true)
+                .then(queued.resolve, queued.reject)
+                .finally(() => {
+                    queued.worker = null;
+                    this.dispatch();
+                });
+        }
+    }
+
+    private availableWorker(): PythonWorker | null {
+        const idle = this._workers.find((worker) => !worker.busy);
+        if (idle !== undefined) {
+            return idle;
+        }
+        if (this._workers.length < this.size) {
+            const worker = new PythonWorker(this.pythonPath, this.scriptPath);
+            this._workers.push(worker);
+            return worker;
+        }
+        return null;
+    }
+
+    private abort(queued: QueuedRequest): boolean {
+        const index = this._queue.indexOf(queued);
+        if (index !== -1) {
+            this._queue.splice(index, 1);
+            queued.reject(
+                new Error(
+                    'Request was aborted before it started. This usually happens when a plot operation times out, or if the plot operation was cancelled by the user.',
+                ),
+            );
+            return true;
+        }
+        if (queued.worker !== null) {
+            queued.worker.kill();
+            return true;
+        }
+        return false;
+    }
+}
@@ -286,6 +286,12 @@ suite('PythonManager Test Suite', () => {
         }
     });
 
+    test('should dispose worker when none was started', () => {
+        pythonManager.disposeWorker();
+        pythonManager.disposeWorker();
+        assert.ok(true);
+    });
+
     test('should setup interpreter change listener', async () => {
         // Configure mock to return extension that fails to activate
         configureMockGetExtension({